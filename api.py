@@ -7,19 +7,68 @@ Safety-aware implementation with:
 - Detailed error handling
 - Audit logging
 """
-import requests
-from typing import Optional, Dict, Any, List
+import asyncio
+import time
+import httpx
+from typing import Optional, Dict, Any, List, Iterator, Awaitable
 from dataclasses import dataclass
 from rich.console import Console
 
+try:
+    import orjson
+except ImportError:  # Optional - falls back to the stdlib parser
+    orjson = None
+
 from config import LovableConfig, get_config
-from safety import get_safety_manager, SafetyManager
+from safety import get_safety_manager, SafetyManager, AsyncTokenBucket
 
 console = Console()
 
 # Request timeout (seconds) - prevents hanging
 REQUEST_TIMEOUT = 30
 
+# Project page URL prefix (project ID is appended)
+PROJECT_URL_PREFIX = "https://lovable.dev/projects/"
+
+# JSON-style boolean strings for form values
+_BOOL_STR = {True: "true", False: "false"}
+
+# Connection pool - keep warm connections around for bursts like probes
+MAX_CONNECTIONS = 32
+MAX_KEEPALIVE_CONNECTIONS = 4
+
+# Transient failure retries (handled below the safety layer)
+CONNECT_RETRIES = 3  # Retries for failed connection attempts
+RETRY_STATUS_CODES = (502, 503, 504)  # Gateway errors retried for GET requests
+MAX_STATUS_RETRIES = 3
+STATUS_RETRY_BACKOFF = 0.3  # Seconds, doubled per attempt
+
+# Concurrent probe requests in flight at once
+MAX_INFLIGHT_PROBES = 4
+
+# Remaining probes are skipped after this many consecutive hard failures
+# (auth rejected, server error, or no response) - e.g. every probe would 401
+PROBE_FAILURE_LIMIT = 2
+
+# Upper bound on project list pages fetched in one listing
+MAX_PROJECT_PAGES = 10
+
+
+def _json(response: httpx.Response) -> Any:
+    """Parse a JSON response body, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+
+def _pick(data: Dict[str, Any], *keys: str) -> Any:
+    """Return the first non-None value among alternative response keys."""
+    for key in keys:
+        value = data.get(key)
+        if value is not None:
+            return value
+    return None
+
 
 @dataclass
 class RemixResult:
@@ -51,6 +100,16 @@ class LovableAPI:
 
     BASE_URL = "https://api.lovable.dev"
 
+    # Candidate endpoints for discovery, probed in this order
+    PROBE_ENDPOINTS = [
+        ("GET", "/me"),
+        ("GET", "/user"),
+        ("GET", "/profile"),
+        ("GET", "/projects"),
+        ("GET", "/workspaces"),
+        ("GET", "/account"),
+    ]
+
     def __init__(
         self,
         bearer_token: str,
@@ -60,45 +119,88 @@ class LovableAPI:
         self.bearer_token = bearer_token
         self.config = config or get_config()
         self.safety = safety or get_safety_manager()
-        self.session = requests.Session()
-        self.session.headers.update({
-            "Authorization": f"Bearer {bearer_token}",
-            "Content-Type": "application/json",
-            "Accept": "application/json",
-            # Add user-agent to be transparent about automation
-            "User-Agent": "LovableAutomation/1.0 (https://github.com/regassist-lovable)",
-        })
+        # HTTP/2 multiplexes concurrent requests (e.g. probes) over one connection
+        self.session = httpx.Client(
+            transport=httpx.HTTPTransport(
+                http2=True,
+                retries=CONNECT_RETRIES,
+                limits=httpx.Limits(
+                    max_connections=MAX_CONNECTIONS,
+                    max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS,
+                ),
+            ),
+            headers={
+                "Authorization": f"Bearer {bearer_token}",
+                "Content-Type": "application/json",
+                "Accept": "application/json",
+                # Add user-agent to be transparent about automation
+                "User-Agent": "LovableAutomation/1.0 (https://github.com/regassist-lovable)",
+            },
+            timeout=REQUEST_TIMEOUT,
+        )
+        # Async counterpart of self.session, created lazily per event loop
+        self._aclient: Optional[httpx.AsyncClient] = None
+        self._aclient_loop: Optional[asyncio.AbstractEventLoop] = None
 
-    def _request(
+    def _send(
         self,
         method: str,
         endpoint: str,
         data: Optional[Dict] = None,
         params: Optional[Dict] = None,
-        operation_name: str = "api_request",
-    ) -> requests.Response:
+    ) -> httpx.Response:
         """
-        Make an authenticated request to the Lovable API.
+        Send a raw request without rate limiting or audit logging.
 
-        Includes safety checks and rate limiting.
+        GET requests are retried with backoff on transient gateway errors.
+        Other methods are never retried since they may not be idempotent
+        (a retried remix could create a duplicate project).
         """
         url = f"{self.BASE_URL}{endpoint}"
-
-        # Wait for rate limit before request
-        self.safety.wait_for_rate_limit()
-
-        console.print(f"[dim]→ {method} {url}[/dim]")
-
-        try:
+        attempt = 0
+        while True:
             response = self.session.request(
                 method=method,
                 url=url,
                 json=data,
                 params=params,
-                timeout=REQUEST_TIMEOUT,
             )
+            if (
+                method != "GET"
+                or response.status_code not in RETRY_STATUS_CODES
+                or attempt >= MAX_STATUS_RETRIES
+            ):
+                return response
+            time.sleep(STATUS_RETRY_BACKOFF * (2 ** attempt))
+            attempt += 1
+
+    def _request(
+        self,
+        method: str,
+        endpoint: str,
+        data: Optional[Dict] = None,
+        params: Optional[Dict] = None,
+        operation_name: str = "api_request",
+        rate_limit: bool = True,
+    ) -> httpx.Response:
+        """
+        Make an authenticated request to the Lovable API.
+
+        Includes safety checks and rate limiting. Pass rate_limit=False when
+        the operation's tokens were already taken by pre_operation_check().
+        """
+        # Wait for rate limit before request
+        if rate_limit:
+            self.safety.wait_for_rate_limit()
+
+        if self.config.verbose:
+            console.print(f"[dim]→ {method} {self.BASE_URL}{endpoint}[/dim]")
 
-            console.print(f"[dim]← {response.status_code}[/dim]")
+        try:
+            response = self._send(method, endpoint, data=data, params=params)
+
+            if self.config.verbose:
+                console.print(f"[dim]← {response.status_code}[/dim]")
 
             # Record the request
             self.safety.record_request(
@@ -110,7 +212,7 @@ class LovableAPI:
 
             return response
 
-        except requests.Timeout:
+        except httpx.TimeoutException:
             error_msg = f"Request timeout after {REQUEST_TIMEOUT}s"
             console.print(f"[red]✗ {error_msg}[/red]")
             self.safety.record_request(
@@ -121,7 +223,7 @@ class LovableAPI:
             )
             raise
 
-        except requests.RequestException as e:
+        except httpx.HTTPError as e:
             error_msg = f"Request failed: {str(e)}"
             console.print(f"[red]✗ {error_msg}[/red]")
             self.safety.record_request(
@@ -161,6 +263,7 @@ class LovableAPI:
             operation="remix",
             project_id=project_id,
             skip_confirmation=skip_confirmation,
+            include_history=include_history,
         )
 
         if not allowed:
@@ -175,34 +278,36 @@ class LovableAPI:
             response = self._request(
                 method="POST",
                 endpoint=f"/projects/{project_id}/remix",
-                data={"include_history": str(include_history).lower()},
+                data={"include_history": _BOOL_STR[bool(include_history)]},
                 operation_name="remix",
+                # Already charged OPERATION_COSTS["remix"] by the pre-check
+                rate_limit=False,
             )
 
             if response.status_code in (200, 201):
-                data = response.json()
+                data = _json(response)
                 console.print(f"[green]✓ Remix created successfully![/green]")
                 console.print(f"[dim]Response: {data}[/dim]")
 
                 # Extract project info from response
                 # Note: Response structure may vary
-                new_project_id = data.get("id") or data.get("project_id") or data.get("projectId")
+                new_project_id = _pick(data, "id", "project_id", "projectId")
 
                 # Record successful remix for idempotency
                 if new_project_id:
-                    self.safety.record_remix_success(project_id, new_project_id)
+                    self.safety.record_remix_success(project_id, new_project_id, include_history)
 
                 return RemixResult(
                     success=True,
                     project_id=new_project_id,
-                    project_url=f"https://lovable.dev/projects/{new_project_id}" if new_project_id else None,
+                    project_url=PROJECT_URL_PREFIX + new_project_id if new_project_id else None,
                     raw_response=data,
                     response_code=response.status_code,
                 )
             else:
                 error_msg = f"Remix failed with status {response.status_code}"
                 try:
-                    error_data = response.json()
+                    error_data = _json(response)
                     error_msg = f"{error_msg}: {error_data}"
                 except:
                     error_msg = f"{error_msg}: {response.text}"
@@ -220,58 +325,65 @@ class LovableAPI:
             console.print(f"[red]✗ {error_msg}[/red]")
             return RemixResult(success=False, error=error_msg)
 
-    def list_projects(self) -> List[Project]:
+    def iter_projects(self) -> Iterator[Project]:
         """
-        List all projects for the authenticated user.
+        Yield projects for the authenticated user one at a time.
+
+        Callers that only need the first few projects can stop early
+        without building the whole list. Yields nothing if the request fails.
 
         Note: This endpoint is undocumented and may not exist.
         """
-        # Simple rate limit check (not a critical operation)
-        self.safety.wait_for_rate_limit()
-
         console.print("[blue]Listing projects...[/blue]")
 
-        try:
-            response = self._request(
-                method="GET",
-                endpoint="/projects",
-                operation_name="list_projects",
+        response = self._request(
+            method="GET",
+            endpoint="/projects",
+            operation_name="list_projects",
+        )
+
+        if response.status_code != 200:
+            console.print(f"[red]✗ Failed to list projects: {response.status_code}[/red]")
+            return
+
+        yield from self._parse_projects(_json(response))
+
+    def _parse_projects(self, data: Any) -> Iterator[Project]:
+        """Yield projects from a /projects response body."""
+        # Handle different response structures
+        items = data if isinstance(data, list) else data.get("projects", data.get("items", []))
+
+        for item in items:
+            yield Project(
+                id=item.get("id", ""),
+                name=item.get("name", "Unnamed"),
+                url=PROJECT_URL_PREFIX + item.get("id", ""),
+                created_at=_pick(item, "created_at", "createdAt"),
+                updated_at=_pick(item, "updated_at", "updatedAt"),
             )
 
-            if response.status_code == 200:
-                data = response.json()
-                projects = []
-
-                # Handle different response structures
-                items = data if isinstance(data, list) else data.get("projects", data.get("items", []))
-
-                for item in items:
-                    projects.append(Project(
-                        id=item.get("id", ""),
-                        name=item.get("name", "Unnamed"),
-                        url=f"https://lovable.dev/projects/{item.get('id', '')}",
-                        created_at=item.get("created_at") or item.get("createdAt"),
-                        updated_at=item.get("updated_at") or item.get("updatedAt"),
-                    ))
-
-                console.print(f"[green]✓ Found {len(projects)} projects[/green]")
-                return projects
-            else:
-                console.print(f"[red]✗ Failed to list projects: {response.status_code}[/red]")
-                return []
+    def list_projects(self) -> List[Project]:
+        """
+        List all projects for the authenticated user.
 
+        Note: This endpoint is undocumented and may not exist.
+        """
+        try:
+            projects = list(self.iter_projects())
         except Exception as e:
             console.print(f"[red]✗ Error listing projects: {e}[/red]")
             return []
 
+        if projects:
+            console.print(f"[green]✓ Found {len(projects)} projects[/green]")
+        return projects
+
     def get_project(self, project_id: str) -> Optional[Project]:
         """
         Get details for a specific project.
 
         Note: This endpoint is undocumented and may not exist.
         """
-        self.safety.wait_for_rate_limit()
-
         console.print(f"[blue]Getting project: {project_id}[/blue]")
 
         try:
@@ -282,13 +394,13 @@ class LovableAPI:
             )
 
             if response.status_code == 200:
-                data = response.json()
+                data = _json(response)
                 return Project(
                     id=data.get("id", project_id),
                     name=data.get("name", "Unnamed"),
-                    url=f"https://lovable.dev/projects/{project_id}",
-                    created_at=data.get("created_at") or data.get("createdAt"),
-                    updated_at=data.get("updated_at") or data.get("updatedAt"),
+                    url=PROJECT_URL_PREFIX + project_id,
+                    created_at=_pick(data, "created_at", "createdAt"),
+                    updated_at=_pick(data, "updated_at", "updatedAt"),
                 )
             else:
                 console.print(f"[yellow]Could not get project details: {response.status_code}[/yellow]")
@@ -298,41 +410,233 @@ class LovableAPI:
             console.print(f"[red]✗ Error getting project: {e}[/red]")
             return None
 
+    def close(self) -> None:
+        """Close the pooled HTTP connections."""
+        self.session.close()
+
+    def _async_client(self) -> httpx.AsyncClient:
+        """
+        Get the pooled async client, configured like the sync session.
+
+        The client is bound to the running event loop, so a new one is
+        created when called from a different loop (e.g. a later asyncio.run).
+        """
+        loop = asyncio.get_running_loop()
+        if self._aclient is None or self._aclient_loop is not loop:
+            self._aclient = httpx.AsyncClient(
+                transport=httpx.AsyncHTTPTransport(
+                    http2=True,
+                    retries=CONNECT_RETRIES,
+                    limits=httpx.Limits(
+                        max_connections=MAX_CONNECTIONS,
+                        max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS,
+                    ),
+                ),
+                headers=self.session.headers,
+                timeout=REQUEST_TIMEOUT,
+            )
+            self._aclient_loop = loop
+        return self._aclient
+
+    async def aclose(self) -> None:
+        """Close the pooled async HTTP connections."""
+        if self._aclient is not None:
+            await self._aclient.aclose()
+            self._aclient = None
+            self._aclient_loop = None
+
+    def run(self, coro: Awaitable[Any]) -> Any:
+        """Run an async API call to completion, then close the async pool."""
+        async def main() -> Any:
+            try:
+                return await coro
+            finally:
+                await self.aclose()
+
+        return asyncio.run(main())
+
+    async def _arequest(
+        self,
+        client: httpx.AsyncClient,
+        bucket: AsyncTokenBucket,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict] = None,
+        operation_name: str = "api_request",
+    ) -> httpx.Response:
+        """Async counterpart of _request: rate limited and recorded."""
+        await bucket.acquire()
+
+        try:
+            response = await client.request(method, f"{self.BASE_URL}{endpoint}", params=params)
+        except httpx.HTTPError as e:
+            error_msg = f"Request failed: {str(e)}"
+            console.print(f"[red]✗ {error_msg}[/red]")
+            await self.safety.record_request_async(
+                operation=operation_name,
+                endpoint=endpoint,
+                success=False,
+                error=error_msg,
+            )
+            raise
+
+        if self.config.verbose:
+            console.print(f"[dim]← {response.status_code} {method} {endpoint}[/dim]")
+        await self.safety.record_request_async(
+            operation=operation_name,
+            endpoint=endpoint,
+            success=response.status_code in (200, 201),
+            response_code=response.status_code,
+        )
+        return response
+
+    async def list_projects_async(self) -> List[Project]:
+        """
+        List all projects for the authenticated user.
+
+        If the first response reports more pages (total_pages / totalPages),
+        the remaining pages are fetched concurrently, up to MAX_PROJECT_PAGES.
+
+        Note: This endpoint is undocumented and may not exist.
+        """
+        console.print("[blue]Listing projects...[/blue]")
+
+        bucket = AsyncTokenBucket(self.safety)
+
+        try:
+            client = self._async_client()
+            response = await self._arequest(
+                client, bucket, "GET", "/projects", operation_name="list_projects",
+            )
+            if response.status_code != 200:
+                console.print(f"[red]✗ Failed to list projects: {response.status_code}[/red]")
+                return []
+
+            pages = [_json(response)]
+
+            total_pages = _pick(pages[0], "total_pages", "totalPages") if isinstance(pages[0], dict) else None
+            if total_pages and int(total_pages) > 1:
+                last_page = min(int(total_pages), MAX_PROJECT_PAGES)
+                responses = await asyncio.gather(*[
+                    self._arequest(
+                        client, bucket, "GET", "/projects",
+                        params={"page": page}, operation_name="list_projects",
+                    )
+                    for page in range(2, last_page + 1)
+                ])
+                pages.extend(_json(r) for r in responses if r.status_code == 200)
+
+            projects = [project for data in pages for project in self._parse_projects(data)]
+
+        except Exception as e:
+            console.print(f"[red]✗ Error listing projects: {e}[/red]")
+            return []
+
+        if projects:
+            console.print(f"[green]✓ Found {len(projects)} projects[/green]")
+        return projects
+
+    async def _aprobe(self, limit: int) -> List[Any]:
+        """
+        Issue probe requests concurrently.
+
+        Each probe takes a rate limit token without blocking the event loop,
+        and at most MAX_INFLIGHT_PROBES run at once. After PROBE_FAILURE_LIMIT
+        consecutive hard failures, probes that have not started are skipped.
+
+        Returns responses (the raised exceptions, or None for skipped probes)
+        in endpoint order.
+        """
+        bucket = AsyncTokenBucket(self.safety)
+        semaphore = asyncio.Semaphore(MAX_INFLIGHT_PROBES)
+        failures = 0
+
+        client = self._async_client()
+
+        async def probe(method: str, endpoint: str) -> Optional[httpx.Response]:
+            nonlocal failures
+            async with semaphore:
+                if failures >= PROBE_FAILURE_LIMIT:
+                    return None
+                await bucket.acquire()
+                if failures >= PROBE_FAILURE_LIMIT:
+                    return None
+                try:
+                    response = await client.request(method, f"{self.BASE_URL}{endpoint}")
+                except Exception:
+                    failures += 1
+                    raise
+                if response.status_code in (401, 403) or response.status_code >= 500:
+                    failures += 1
+                else:
+                    failures = 0
+                return response
+
+        return await asyncio.gather(
+            *[probe(method, endpoint) for method, endpoint in self.PROBE_ENDPOINTS[:limit]],
+            return_exceptions=True,
+        )
+
     def probe_endpoints(self, limit: int = 6) -> Dict[str, Any]:
         """
         Probe various potential API endpoints to discover available functionality.
 
+        Sync wrapper around probe_endpoints_async().
+        """
+        return self.run(self.probe_endpoints_async(limit))
+
+    async def probe_endpoints_async(self, limit: int = 6) -> Dict[str, Any]:
+        """
+        Probe various potential API endpoints to discover available functionality.
+
         This is for research/experimentation purposes.
         Limited to prevent excessive requests.
         """
         console.print("[blue]Probing API endpoints...[/blue]")
         console.print(f"[dim]Limited to {limit} endpoints for safety[/dim]")
 
-        endpoints_to_try = [
-            ("GET", "/me"),
-            ("GET", "/user"),
-            ("GET", "/profile"),
-            ("GET", "/projects"),
-            ("GET", "/workspaces"),
-            ("GET", "/account"),
-        ][:limit]  # Limit number of probes
+        endpoints_to_try = self.PROBE_ENDPOINTS[:limit]  # Limit number of probes
+
+        # Probes are independent, so they run concurrently (rate limited per probe)
+        responses = await self._aprobe(limit)
 
         results = {}
 
-        for method, endpoint in endpoints_to_try:
-            # Rate limit between probes
-            self.safety.wait_for_rate_limit()
+        for (method, endpoint), response in zip(endpoints_to_try, responses):
+            if response is None:
+                console.print(f"[yellow]- {endpoint}: skipped after repeated failures[/yellow]")
+                results[endpoint] = {"status": "skipped"}
+                continue
+
+            if isinstance(response, Exception):
+                error_msg = f"Request failed: {str(response)}"
+                console.print(f"[red]✗ {endpoint}: {error_msg}[/red]")
+                await self.safety.record_request_async(
+                    operation="probe",
+                    endpoint=endpoint,
+                    success=False,
+                    error=error_msg,
+                )
+                results[endpoint] = {
+                    "status": "error",
+                    "error": str(response),
+                }
+                continue
+
+            if self.config.verbose:
+                console.print(f"[dim]← {response.status_code} {endpoint}[/dim]")
+            await self.safety.record_request_async(
+                operation="probe",
+                endpoint=endpoint,
+                success=response.status_code in (200, 201),
+                response_code=response.status_code,
+            )
 
             try:
-                response = self._request(
-                    method,
-                    endpoint,
-                    operation_name="probe",
-                )
                 results[endpoint] = {
                     "status": response.status_code,
                     "success": response.status_code == 200,
-                    "data": response.json() if response.status_code == 200 else None,
+                    "data": _json(response) if response.status_code == 200 else None,
                 }
             except Exception as e:
                 results[endpoint] = {
@@ -343,6 +647,20 @@ class LovableAPI:
         return results
 
 
+# Global client instance - shares its connection pools per process
+_api: Optional[LovableAPI] = None
+
+
+def get_api(bearer_token: str) -> LovableAPI:
+    """Get or create the global API client for a bearer token."""
+    global _api
+    if _api is None or _api.bearer_token != bearer_token:
+        if _api is not None:
+            _api.close()
+        _api = LovableAPI(bearer_token)
+    return _api
+
+
 if __name__ == "__main__":
     # Test API client
     from auth import get_or_refresh_token
@@ -351,7 +669,7 @@ if __name__ == "__main__":
     if error:
         console.print(f"[red]Auth error: {error}[/red]")
     else:
-        api = LovableAPI(token)
+        api = get_api(token)
 
         # Show safety status
         api.safety.print_status()
@@ -6,11 +6,23 @@ Handles:
 2. Bearer token extraction from network requests
 3. Session persistence for reuse
 """
+import base64
 import json
+import os
+import re
+import tempfile
 import time
+from concurrent.futures import Future
 from pathlib import Path
-from typing import Optional, Tuple
-from playwright.sync_api import sync_playwright, Page, Browser, BrowserContext
+from typing import Optional, Tuple, Dict, Any
+from playwright.sync_api import (
+    sync_playwright,
+    Playwright,
+    Page,
+    Browser,
+    BrowserContext,
+    TimeoutError as PlaywrightTimeout,
+)
 from rich.console import Console
 from rich.panel import Panel
 
@@ -18,21 +30,156 @@ from config import LovableConfig, get_config
 
 console = Console()
 
+# Timeouts (milliseconds)
+FORM_TIMEOUT = 10000  # Login form fields to appear
+LOGIN_TIMEOUT = 15000  # First bearer token request after submitting credentials
+SESSION_CHECK_TIMEOUT = 10000  # Token or login redirect when validating a session
+
+# Skip browser session validation when the token is valid for at least this long
+TOKEN_EXPIRY_MARGIN_SECONDS = 300
+
+# Last known-good token for this process: {"token": str, "exp": Optional[float]}
+_TOKEN_CACHE: Dict[str, Any] = {}
+
+
+def _token_expiry(token: str) -> Optional[float]:
+    """Read the `exp` claim from a JWT bearer token (signature is not verified)."""
+    try:
+        payload = token.split(".")[1]
+        claims = json.loads(base64.urlsafe_b64decode(payload + "=" * (-len(payload) % 4)))
+        return float(claims["exp"])
+    except Exception:
+        return None
+
+
+def _is_fresh(exp: Optional[float]) -> bool:
+    """Check if a token expiry is far enough in the future to skip validation."""
+    return exp is not None and exp - time.time() > TOKEN_EXPIRY_MARGIN_SECONDS
+
+
+def _cache_token(token: str) -> None:
+    """Remember a validated token for the rest of the process."""
+    _TOKEN_CACHE["token"] = token
+    _TOKEN_CACHE["exp"] = _token_expiry(token)
+
+
+class TokenStore:
+    """
+    Saved bearer token file.
+
+    load() keeps the last read value and only re-reads the file when its
+    mtime changes; save() replaces the file atomically.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._mtime_ns: Optional[int] = None
+        self._cached: Optional[str] = None
+
+    def load(self) -> Optional[str]:
+        """Return the saved token, or None if there is none."""
+        try:
+            mtime_ns = self.path.stat().st_mtime_ns
+        except FileNotFoundError:
+            self._mtime_ns = None
+            self._cached = None
+            return None
+
+        if mtime_ns != self._mtime_ns:
+            self._cached = self.path.read_text().strip() or None
+            self._mtime_ns = mtime_ns
+        return self._cached
+
+    def save(self, token: str) -> None:
+        """Replace the saved token."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        # Own temp file - another auth run or the daemon may be saving too
+        with tempfile.NamedTemporaryFile(
+            "w", dir=self.path.parent, prefix=f"{self.path.name}.", suffix=".tmp", delete=False,
+        ) as tmp:
+            tmp.write(token)
+        try:
+            os.replace(tmp.name, self.path)
+        except BaseException:
+            os.unlink(tmp.name)
+            raise
+        self._cached = token
+        self._mtime_ns = self.path.stat().st_mtime_ns
+
 
 class LovableAuth:
-    """Handles Lovable authentication via Playwright."""
+    """
+    Handles Lovable authentication via Playwright.
+
+    Browsers are launched on first use and reused until close() is called:
+    a headless one for session checks, and one with the configured
+    headless/slow_mo options for interactive logins. Use as a context manager:
+
+        with LovableAuth(config) as auth:
+            token, error = auth.login_and_extract_token()
+    """
 
     LOVABLE_URL = "https://lovable.dev"
     LOGIN_URL = "https://lovable.dev/login"
     API_BASE = "https://api.lovable.dev"
 
+    # Login form selectors
+    _EMAIL_SEL = 'input[type="email"]'
+    _PASSWORD_SEL = 'input[type="password"]'
+    _CONTINUE_SEL = 'button:has-text("Continue")'
+    _LOGIN_BTN_RE = re.compile(r"log\s*in", re.I)
+    _SUBMIT_SEL = 'button[type="submit"]'
+    _LOGGED_IN_SEL = (
+        '[data-testid="projects-list"], [href="/projects"], '
+        '[aria-label="Create new project"], button:has-text("New project")'
+    )
+
     def __init__(self, config: Optional[LovableConfig] = None):
         self.config = config or get_config()
         self.bearer_token: Optional[str] = None
-        self._browser: Optional[Browser] = None
+        self.token_store = TokenStore(self.config.session_dir / "bearer_token.txt")
+        self._playwright: Optional[Playwright] = None
+        self._browsers: Dict[bool, Browser] = {}  # interactive -> browser
         self._context: Optional[BrowserContext] = None
         self._page: Optional[Page] = None
 
+    def __enter__(self) -> "LovableAuth":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def _get_browser(self, interactive: bool = False) -> Browser:
+        """
+        Launch a browser on first use and reuse it afterwards.
+
+        Session checks always run headless without slow-mo (they must work on
+        display-less hosts); only interactive logins use the configured options.
+        """
+        browser = self._browsers.get(interactive)
+        if browser is None:
+            console.print("[blue]Launching browser...[/blue]")
+            if self._playwright is None:
+                self._playwright = sync_playwright().start()
+            if interactive:
+                browser = self._playwright.chromium.launch(
+                    headless=self.config.headless,
+                    slow_mo=self.config.slow_mo,
+                )
+            else:
+                browser = self._playwright.chromium.launch(headless=True)
+            self._browsers[interactive] = browser
+        return browser
+
+    def close(self) -> None:
+        """Close the shared browsers and stop Playwright."""
+        for browser in self._browsers.values():
+            browser.close()
+        self._browsers.clear()
+        if self._playwright is not None:
+            self._playwright.stop()
+            self._playwright = None
+
     def _extract_token_from_request(self, request) -> Optional[str]:
         """Extract bearer token from a request's authorization header."""
         auth_header = request.headers.get("authorization", "")
@@ -40,18 +187,38 @@ class LovableAuth:
             return auth_header[7:]
         return None
 
-    def _setup_request_interceptor(self, page: Page) -> list:
-        """Set up request interception to capture bearer tokens."""
-        captured_tokens = []
+    def _setup_request_interceptor(self, page: Page) -> Future:
+        """
+        Set up request interception to capture the bearer token.
+
+        Returns a future resolved with the first token seen.
+        """
+        token_future: Future = Future()
 
         def handle_request(request):
             # Capture from any authenticated request
             token = self._extract_token_from_request(request)
-            if token and token not in captured_tokens:
-                captured_tokens.append(token)
+            if token and not token_future.done():
+                token_future.set_result(token)
 
         page.on("request", handle_request)
-        return captured_tokens
+        return token_future
+
+    def _wait_for_token_request(self, page: Page, timeout: int, stop_on_login: bool = False) -> None:
+        """
+        Block until a request carrying a bearer token is sent.
+
+        Playwright's sync API only dispatches events while a Playwright call
+        is running, so this waits on the page event rather than the future.
+        """
+        page.wait_for_event(
+            "request",
+            predicate=lambda request: (
+                self._extract_token_from_request(request) is not None
+                or (stop_on_login and "/login" in page.url)
+            ),
+            timeout=timeout,
+        )
 
     def login_with_email_password(self) -> Tuple[str, Optional[str]]:
         """
@@ -68,77 +235,67 @@ class LovableAuth:
         if not self.config.has_credentials():
             return "", "No email/password credentials configured"
 
-        with sync_playwright() as p:
-            console.print("[blue]Launching browser...[/blue]")
-
-            browser = p.chromium.launch(
-                headless=self.config.headless,
-                slow_mo=self.config.slow_mo,
-            )
+        context = self._get_browser(interactive=True).new_context()
+        page = context.new_page()
+        token_future = self._setup_request_interceptor(page)
 
-            context = browser.new_context()
-            page = context.new_page()
-            captured_tokens = self._setup_request_interceptor(page)
-
-            try:
-                # Step 1: Navigate to login page
-                console.print("[blue]Navigating to login...[/blue]")
-                page.goto(self.LOGIN_URL, wait_until="domcontentloaded")
-                page.wait_for_timeout(2000)
-
-                # Step 2: Enter email
-                console.print("[blue]Entering email...[/blue]")
-                email_input = page.locator('input[type="email"]').first
-                email_input.wait_for(state="visible", timeout=10000)
-                email_input.fill(self.config.email)
-
-                # Step 3: Click Continue
-                continue_btn = page.locator('button:has-text("Continue")').last
-                continue_btn.click()
-                page.wait_for_timeout(2000)
-
-                # Step 4: Wait for and fill password
-                console.print("[blue]Entering password...[/blue]")
-                password_input = page.locator('input[type="password"]').first
-                password_input.wait_for(state="visible", timeout=10000)
-                password_input.fill(self.config.password)
-
-                # Step 5: Click Log In
-                login_btn = page.locator('button:has-text("Log in"), button:has-text("Log In"), button[type="submit"]').first
-                login_btn.click()
-
-                # Step 6: Wait for redirect (login complete)
-                console.print("[blue]Waiting for login to complete...[/blue]")
-                page.wait_for_url(lambda url: "/login" not in url, timeout=15000)
+        try:
+            # Step 1: Navigate to login page
+            console.print("[blue]Navigating to login...[/blue]")
+            page.goto(self.LOGIN_URL, wait_until="domcontentloaded")
+
+            # Step 2: Enter email
+            console.print("[blue]Entering email...[/blue]")
+            email_input = page.locator(self._EMAIL_SEL).first
+            email_input.wait_for(state="visible", timeout=FORM_TIMEOUT)
+            email_input.fill(self.config.email)
+
+            # Step 3: Click Continue
+            continue_btn = page.locator(self._CONTINUE_SEL).last
+            continue_btn.click()
+
+            # Step 4: Wait for and fill password
+            console.print("[blue]Entering password...[/blue]")
+            password_input = page.locator(self._PASSWORD_SEL).first
+            password_input.wait_for(state="visible", timeout=FORM_TIMEOUT)
+            password_input.fill(self.config.password)
+
+            # Step 5: Click Log In
+            login_btn = page.get_by_role("button", name=self._LOGIN_BTN_RE).or_(
+                page.locator(self._SUBMIT_SEL)
+            ).first
+            login_btn.click()
+
+            # Step 6: Wait for the first authenticated request (login complete).
+            # The request interceptor resolves the token future from it.
+            console.print("[blue]Waiting for login to complete...[/blue]")
+            if not token_future.done():
+                # A timeout here means bad credentials or a stuck login -
+                # reported through the login error path below
+                self._wait_for_token_request(page, timeout=LOGIN_TIMEOUT)
+
+            # Get the token
+            if token_future.done():
                 console.print("[green]✓ Login successful![/green]")
+                self.bearer_token = token_future.result()
 
-                # Step 7: Navigate to projects to ensure we have a token
-                page.goto(f"{self.LOVABLE_URL}/projects", wait_until="domcontentloaded")
-                page.wait_for_timeout(3000)
-
-                # Get the token
-                if captured_tokens:
-                    self.bearer_token = captured_tokens[0]
+                # Save session for reuse
+                console.print("[blue]Saving session...[/blue]")
+                session_file = self.config.get_session_file()
+                context.storage_state(path=str(session_file))
 
-                    # Save session for reuse
-                    console.print("[blue]Saving session...[/blue]")
-                    session_file = self.config.get_session_file()
-                    storage_state = context.storage_state()
-                    session_file.write_text(json.dumps(storage_state, indent=2))
+                # Save token
+                self.token_store.save(self.bearer_token)
 
-                    # Save token
-                    token_file = self.config.session_dir / "bearer_token.txt"
-                    token_file.write_text(self.bearer_token)
+                console.print("[green]✓ Session and token saved![/green]")
+                return self.bearer_token, None
+            else:
+                return "", "Login succeeded but no bearer token captured"
 
-                    console.print("[green]✓ Session and token saved![/green]")
-                    return self.bearer_token, None
-                else:
-                    return "", "Login succeeded but no bearer token captured"
-
-            except Exception as e:
-                return "", f"Login error: {str(e)}"
-            finally:
-                browser.close()
+        except Exception as e:
+            return "", f"Login error: {str(e)}"
+        finally:
+            context.close()
 
     def login_and_extract_token(self) -> Tuple[str, Optional[str]]:
         """
@@ -165,51 +322,54 @@ class LovableAuth:
     def _validate_session(self, session_file: Path) -> Tuple[bool, Optional[str]]:
         """Check if saved session is still valid."""
         try:
-            with sync_playwright() as p:
-                browser = p.chromium.launch(headless=True)
-                context = browser.new_context(storage_state=str(session_file))
-                page = context.new_page()
-
-                captured_tokens = self._setup_request_interceptor(page)
-
-                # Try to access projects page
-                page.goto(f"{self.LOVABLE_URL}/projects", wait_until="domcontentloaded")
-                page.wait_for_timeout(3000)
-
-                # Check if we got redirected to login
-                if "/login" in page.url:
-                    browser.close()
-                    return False, None
-
-                # Check if we captured a token
-                if captured_tokens:
-                    # Update saved token
-                    token_file = self.config.session_dir / "bearer_token.txt"
-                    token_file.write_text(captured_tokens[0])
-                    browser.close()
-                    return True, captured_tokens[0]
-
-                # Check for saved token
-                token_file = self.config.session_dir / "bearer_token.txt"
-                if token_file.exists():
-                    browser.close()
-                    return True, token_file.read_text().strip()
-
-                browser.close()
+            context = self._get_browser().new_context(storage_state=str(session_file))
+        except Exception as e:
+            console.print(f"[yellow]Session validation failed: {e}[/yellow]")
+            return False, None
+
+        try:
+            page = context.new_page()
+
+            token_future = self._setup_request_interceptor(page)
+
+            # Try to access projects page
+            page.goto(f"{self.LOVABLE_URL}/projects", wait_until="domcontentloaded")
+
+            # Wait until the app either makes an authenticated call or bounces to login
+            if not token_future.done() and "/login" not in page.url:
+                try:
+                    self._wait_for_token_request(page, timeout=SESSION_CHECK_TIMEOUT, stop_on_login=True)
+                except PlaywrightTimeout:
+                    pass  # Fall back to the saved token checks below
+
+            # Check if we got redirected to login
+            if "/login" in page.url:
                 return False, None
 
+            # Check if we captured a token
+            if token_future.done():
+                token = token_future.result()
+                # Update saved token
+                self.token_store.save(token)
+                return True, token
+
+            # Check for saved token
+            saved_token = self.token_store.load()
+            if saved_token:
+                return True, saved_token
+
+            return False, None
+
         except Exception as e:
             console.print(f"[yellow]Session validation failed: {e}[/yellow]")
             return False, None
+        finally:
+            context.close()
 
     def _is_logged_in(self, page: Page) -> bool:
         """Check if user is already logged in."""
         try:
-            page.wait_for_selector(
-                '[data-testid="projects-list"], [href="/projects"], '
-                '[aria-label="Create new project"], button:has-text("New project")',
-                timeout=3000
-            )
+            page.wait_for_selector(self._LOGGED_IN_SEL, timeout=3000)
             return True
         except:
             return False
@@ -224,28 +384,42 @@ def get_or_refresh_token(config: Optional[LovableConfig] = None) -> Tuple[str, O
     """
     config = config or get_config()
 
-    # Check for saved token
-    token_file = config.session_dir / "bearer_token.txt"
-    session_file = config.get_session_file()
+    # Check in-process cache first
+    cached_token = _TOKEN_CACHE.get("token")
+    if cached_token and _is_fresh(_TOKEN_CACHE.get("exp")):
+        return cached_token, None
 
-    if token_file.exists() and session_file.exists():
-        saved_token = token_file.read_text().strip()
-        if saved_token:
-            # Validate the session is still good
-            auth = LovableAuth(config)
-            is_valid, token = auth._validate_session(session_file)
-            if is_valid and token:
-                console.print("[green]✓ Using valid saved session[/green]")
-                return token, None
+    session_file = config.get_session_file()
 
-    # Check if token provided in config/env
-    if config.has_token():
-        console.print("[green]Using token from environment[/green]")
-        return config.bearer_token, None
+    # One browser is shared by session validation and login, launched only if needed
+    with LovableAuth(config) as auth:
+        # Check for saved token
+        if session_file.exists():
+            saved_token = auth.token_store.load()
+            if saved_token:
+                # Token is not close to expiring, no need to launch a browser
+                if _is_fresh(_token_expiry(saved_token)):
+                    console.print("[green]✓ Using valid saved token[/green]")
+                    _cache_token(saved_token)
+                    return saved_token, None
+
+                # Validate the session is still good
+                is_valid, token = auth._validate_session(session_file)
+                if is_valid and token:
+                    console.print("[green]✓ Using valid saved session[/green]")
+                    _cache_token(token)
+                    return token, None
+
+        # Check if token provided in config/env
+        if config.has_token():
+            console.print("[green]Using token from environment[/green]")
+            return config.bearer_token, None
 
-    # Need to login
-    auth = LovableAuth(config)
-    return auth.login_and_extract_token()
+        # Need to login
+        token, error = auth.login_and_extract_token()
+        if token and not error:
+            _cache_token(token)
+        return token, error
 
 
 if __name__ == "__main__":
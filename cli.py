@@ -9,25 +9,55 @@ Commands:
 - projects: List projects (if endpoint exists)
 - status: Show safety status and limits
 - reset: Reset safety state (with confirmation)
+- serve: Run the remix daemon (keeps a browser warm)
 """
 import sys
 import json
 import argparse
-from pathlib import Path
-from rich.console import Console
-from rich.table import Table
-from rich.panel import Panel
+from itertools import islice
+from functools import lru_cache
+from dataclasses import asdict, is_dataclass
 
-from config import LovableConfig, get_config
-from auth import get_or_refresh_token, LovableAuth
-from api import LovableAPI
-from safety import get_safety_manager
+# Heavier modules (rich, playwright, pydantic via config) are imported inside
+# the command that needs them, so --help and simple commands start quickly.
 
-console = Console()
+
+@lru_cache(maxsize=None)
+def _console():
+    """Shared Rich console, created on first use."""
+    from rich.console import Console
+    return Console()
+
+
+def _print_json(data) -> None:
+    """Print a result (dataclass, list of dataclasses or plain data) as JSON."""
+    try:
+        import orjson
+    except ImportError:  # Optional - falls back to the stdlib encoder
+        orjson = None
+
+    if orjson is not None:
+        # orjson serializes dataclasses natively and writes UTF-8 bytes
+        sys.stdout.flush()  # Keep ordering with earlier text output
+        sys.stdout.buffer.write(orjson.dumps(data, option=orjson.OPT_INDENT_2) + b"\n")
+        sys.stdout.buffer.flush()
+        return
+
+    if is_dataclass(data):
+        data = asdict(data)
+    elif isinstance(data, list):
+        data = [asdict(item) if is_dataclass(item) else item for item in data]
+    print(json.dumps(data, indent=2))
 
 
 def cmd_auth(args):
     """Authenticate and display/save bearer token."""
+    from rich.panel import Panel
+    from config import get_config
+    from auth import get_or_refresh_token
+
+    console = _console()
+
     console.print(Panel(
         "[bold]Lovable Authentication[/bold]",
         border_style="blue",
@@ -39,12 +69,12 @@ def cmd_auth(args):
         session_file = config.get_session_file()
         token_file = config.session_dir / "bearer_token.txt"
 
-        if session_file.exists():
-            session_file.unlink()
-            console.print("[yellow]Cleared existing session[/yellow]")
-        if token_file.exists():
-            token_file.unlink()
-            console.print("[yellow]Cleared existing token[/yellow]")
+        for path, label in ((session_file, "session"), (token_file, "token")):
+            try:
+                path.unlink()
+                console.print(f"[yellow]Cleared existing {label}[/yellow]")
+            except FileNotFoundError:
+                pass
 
     token, error = get_or_refresh_token()
 
@@ -65,6 +95,10 @@ def cmd_remix(args):
     """Create a remix of a project."""
     # Import here to avoid circular imports
     from remix import create_remix, interactive_remix
+    from config import get_config
+    from safety import get_safety_manager
+
+    console = _console()
 
     # Show safety status first
     safety = get_safety_manager()
@@ -94,14 +128,21 @@ def cmd_remix(args):
         return 1
 
     if args.json:
-        from dataclasses import asdict
-        print(json.dumps(asdict(result), indent=2))
+        _print_json(result)
 
     return 0 if result.success else 1
 
 
 def cmd_probe(args):
     """Probe API endpoints to discover functionality."""
+    from rich.panel import Panel
+    from rich import box
+    from rich.table import Table
+    from auth import get_or_refresh_token
+    from api import get_api
+
+    console = _console()
+
     console.print(Panel(
         "[bold]API Endpoint Discovery[/bold]\n"
         "Probing various endpoints to discover available functionality.\n"
@@ -114,32 +155,42 @@ def cmd_probe(args):
         console.print(f"[red]Auth error: {error}[/red]")
         return 1
 
-    api = LovableAPI(token)
+    api = get_api(token)
 
-    # Limited probe
-    results = api.probe_endpoints(limit=args.limit)
+    # Limited probe (endpoints are requested concurrently)
+    results = api.run(api.probe_endpoints_async(limit=args.limit))
 
     # Display results
-    table = Table(title="API Endpoints")
+    rows = [
+        (endpoint, str(result.get("status", "error")), "✓" if result.get("success") else "✗")
+        for endpoint, result in results.items()
+    ]
+
+    table = Table(title="API Endpoints", box=box.SIMPLE, show_edge=False)
     table.add_column("Endpoint", style="cyan")
     table.add_column("Status", style="magenta")
     table.add_column("Result", style="green")
-
-    for endpoint, result in results.items():
-        status = str(result.get("status", "error"))
-        success = "✓" if result.get("success") else "✗"
-        table.add_row(endpoint, status, success)
+    for row in rows:
+        table.add_row(*row)
 
     console.print(table)
 
     if args.json:
-        print(json.dumps(results, indent=2))
+        _print_json(results)
 
     return 0
 
 
 def cmd_projects(args):
     """List available projects."""
+    from rich.panel import Panel
+    from rich import box
+    from rich.table import Table
+    from auth import get_or_refresh_token
+    from api import get_api
+
+    console = _console()
+
     console.print(Panel(
         "[bold]Project List[/bold]",
         border_style="blue",
@@ -150,51 +201,62 @@ def cmd_projects(args):
         console.print(f"[red]Auth error: {error}[/red]")
         return 1
 
-    api = LovableAPI(token)
-    projects = api.list_projects()
+    api = get_api(token)
+    projects = api.run(api.list_projects_async())
 
     if not projects:
         console.print("[yellow]No projects found (or endpoint not available)[/yellow]")
         return 1
 
-    table = Table(title="Your Projects")
+    rows = [(project.id, project.name, project.url) for project in projects]
+
+    table = Table(title="Your Projects", box=box.SIMPLE, show_edge=False)
     table.add_column("ID", style="cyan")
     table.add_column("Name", style="green")
     table.add_column("URL", style="blue")
-
-    for project in projects:
-        table.add_row(project.id, project.name, project.url)
+    for row in rows:
+        table.add_row(*row)
 
     console.print(table)
 
     if args.json:
-        from dataclasses import asdict
-        print(json.dumps([asdict(p) for p in projects], indent=2))
+        _print_json(projects)
 
     return 0
 
 
 def cmd_status(args):
     """Show safety status and limits."""
+    from safety import get_safety_manager
+
+    console = _console()
+
     safety = get_safety_manager()
     safety.print_status()
 
     if args.verbose:
         console.print("\n[bold]Recent Request Log:[/bold]")
-        for entry in safety.state.request_log[-10:]:
+        log = safety.state.request_log
+        for entry in islice(log, max(0, len(log) - 10), None):
             status = "✓" if entry.get("success") else "✗"
             console.print(f"  {status} {entry.get('timestamp', '')[:19]} - {entry.get('operation')}")
 
         if safety.state.remix_history:
-            console.print("\n[bold]Remix History (this session):[/bold]")
-            for source, remix in safety.state.remix_history.items():
-                console.print(f"  {source[:8]}... → {remix[:8]}...")
+            # Keys are idempotency hashes (see safety.remix_key), so only remixes are listed
+            console.print("\n[bold]Remix History:[/bold]")
+            for remix in safety.state.remix_history.values():
+                console.print(f"  → {remix}")
 
     return 0
 
 
 def cmd_reset(args):
     """Reset safety state."""
+    from rich.panel import Panel
+    from safety import get_safety_manager
+
+    console = _console()
+
     if not args.confirm:
         console.print(Panel(
             "[yellow bold]Warning: This will reset all safety counters.[/yellow bold]\n\n"
@@ -209,10 +271,12 @@ def cmd_reset(args):
         return 1
 
     safety = get_safety_manager()
-    state_file = safety.state_file
+    existed = safety.state_file.exists()
 
-    if state_file.exists():
-        state_file.unlink()
+    # Reset through the manager - deleting the file would race its writer thread,
+    # which can still put the old state back
+    safety.reset()
+    if existed:
         console.print("[green]✓ Safety state reset[/green]")
     else:
         console.print("[yellow]No safety state to reset[/yellow]")
@@ -222,8 +286,12 @@ def cmd_reset(args):
 
 def cmd_ui_remix(args):
     """Create a remix via UI automation (recommended)."""
-    from ui_remix import ui_remix
-    from dataclasses import asdict
+    from rich.panel import Panel
+    from ui_remix import ui_remix, UIRemixResult
+    from config import get_config
+    from safety import get_safety_manager
+
+    console = _console()
 
     # Show safety status first
     safety = get_safety_manager()
@@ -238,19 +306,37 @@ def cmd_ui_remix(args):
         console.print("Or set LOVABLE_PROJECT_ID environment variable")
         return 1
 
-    result = ui_remix(
-        project_id,
-        include_history=not args.no_history,
-        skip_confirmation=args.yes,
-        debug=args.debug,
-    )
+    reply = None
+    if args.yes and not args.debug:
+        # Hand the remix to a running daemon (warm browser) if there is one.
+        # Prompting and debug remixes always run here: the daemon has no
+        # terminal, and its browser runs without slow-mo.
+        from daemon import send_request
+        reply = send_request({
+            "op": "remix",
+            "project_id": project_id,
+            "include_history": not args.no_history,
+        })
+
+    if reply is not None:
+        if not reply.get("ok"):
+            console.print(f"[red]Daemon error: {reply.get('error')}[/red]")
+            return 1
+        result = UIRemixResult(**reply["result"]) if reply["result"] else None
+    else:
+        result = ui_remix(
+            project_id,
+            include_history=not args.no_history,
+            skip_confirmation=args.yes,
+            debug=args.debug,
+        )
 
     if result is None:
         console.print("[red]Operation was blocked by safety checks[/red]")
         return 1
 
     if args.json:
-        print(json.dumps(asdict(result), indent=2))
+        _print_json(result)
     else:
         if result.success:
             console.print(Panel(
@@ -271,6 +357,26 @@ def cmd_ui_remix(args):
     return 0 if result.success else 1
 
 
+def cmd_serve(args):
+    """Run the remix daemon with a warm browser."""
+    from daemon import serve
+
+    return serve()
+
+
+# Subcommand name -> handler
+COMMANDS = {
+    "auth": cmd_auth,
+    "remix": cmd_remix,
+    "ui-remix": cmd_ui_remix,
+    "probe": cmd_probe,
+    "projects": cmd_projects,
+    "status": cmd_status,
+    "reset": cmd_reset,
+    "serve": cmd_serve,
+}
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Lovable Automation CLI - Safe, rate-limited automation for Lovable",
@@ -284,9 +390,10 @@ Examples:
   python cli.py remix <id> --yes  # Skip confirmation prompt
   python cli.py probe --limit 3   # Probe 3 API endpoints
   python cli.py projects          # List your projects
+  python cli.py serve             # Keep a browser warm for ui-remix --yes
 
 Safety Features:
-  - Rate limiting: 2s between requests, 10/minute, 60/hour
+  - Rate limiting: bursts of 6, then 1 request per 2s, 60/hour
   - Circuit breaker: Stops after 3 consecutive failures
   - Idempotency: Prevents duplicate remixes
   - Daily limits: Max 20 remixes per day
@@ -334,23 +441,16 @@ Safety Features:
     reset_parser = subparsers.add_parser("reset", help="Reset safety state")
     reset_parser.add_argument("--confirm", action="store_true", help="Confirm reset")
 
+    # Serve command
+    subparsers.add_parser("serve", help="Run the remix daemon (keeps a browser warm)")
+
     args = parser.parse_args()
 
     if not args.command:
         parser.print_help()
         return 0
 
-    commands = {
-        "auth": cmd_auth,
-        "remix": cmd_remix,
-        "ui-remix": cmd_ui_remix,
-        "probe": cmd_probe,
-        "projects": cmd_projects,
-        "status": cmd_status,
-        "reset": cmd_reset,
-    }
-
-    return commands[args.command](args)
+    return COMMANDS[args.command](args)
 
 
 if __name__ == "__main__":
@@ -2,14 +2,31 @@
 Configuration management for Lovable automation.
 """
 import os
+import re
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from dotenv import load_dotenv
 
+# Project ID segment of a Lovable project URL
+_PROJECT_ID_RE = re.compile(r"/projects/([a-f0-9-]+)")
+
+
+def extract_project_id(url: str) -> Optional[str]:
+    """Extract project ID from a Lovable URL."""
+    match = _PROJECT_ID_RE.search(url)
+    return match.group(1) if match else None
+
 
 class LovableConfig(BaseModel):
-    """Configuration for Lovable automation."""
+    """
+    Configuration for Lovable automation.
+
+    Immutable - use model_copy(update={...}) to derive a modified config.
+    """
+
+    model_config = ConfigDict(frozen=True)
 
     # Authentication
     email: Optional[str] = Field(default=None, description="Lovable account email")
@@ -23,6 +40,14 @@ class LovableConfig(BaseModel):
     # Browser settings
     headless: bool = Field(default=False, description="Run browser in headless mode")
     slow_mo: int = Field(default=100, description="Slow down operations by this many ms")
+    context_recycle_every: int = Field(default=20, description="Successful UI remixes before the browser context is recreated (0 = never)")
+    block_resources: bool = Field(default=True, description="Skip images, fonts, media and analytics in UI remixes")
+
+    # Remix workflow
+    verify_source: bool = Field(default=False, description="Look up the source project before an API remix")
+
+    # Output
+    verbose: bool = Field(default=False, description="Print per-request trace output")
 
     # Paths
     session_dir: Path = Field(default=Path("session_state"), description="Directory for session storage")
@@ -39,13 +64,9 @@ class LovableConfig(BaseModel):
         project_id = os.getenv("LOVABLE_PROJECT_ID")
 
         # Extract project ID from URL if not provided directly
+        # URL format: https://lovable.dev/projects/{project_id}
         if project_url and not project_id:
-            # URL format: https://lovable.dev/projects/{project_id}
-            parts = project_url.rstrip("/").split("/")
-            if "projects" in parts:
-                idx = parts.index("projects")
-                if idx + 1 < len(parts):
-                    project_id = parts[idx + 1]
+            project_id = extract_project_id(project_url)
 
         return cls(
             email=os.getenv("LOVABLE_EMAIL"),
@@ -55,6 +76,10 @@ class LovableConfig(BaseModel):
             project_url=project_url,
             headless=os.getenv("HEADLESS", "false").lower() == "true",
             slow_mo=int(os.getenv("SLOW_MO", "100")),
+            block_resources=os.getenv("BLOCK_RESOURCES", "true").lower() == "true",
+            context_recycle_every=int(os.getenv("CONTEXT_RECYCLE_EVERY", "20")),
+            verify_source=os.getenv("VERIFY_SOURCE", "false").lower() == "true",
+            verbose=os.getenv("VERBOSE", "false").lower() == "true",
         )
 
     def has_credentials(self) -> bool:
@@ -71,19 +96,18 @@ class LovableConfig(BaseModel):
         return self.session_dir / "lovable_session.json"
 
 
-# Global config instance
-_config: Optional[LovableConfig] = None
+# Config set explicitly via set_config(), takes precedence over the environment
+_config_override: Optional[LovableConfig] = None
 
 
+@lru_cache(maxsize=1)
 def get_config() -> LovableConfig:
     """Get or create the global configuration."""
-    global _config
-    if _config is None:
-        _config = LovableConfig.from_env()
-    return _config
+    return _config_override or LovableConfig.from_env()
 
 
 def set_config(config: LovableConfig) -> None:
     """Set the global configuration."""
-    global _config
-    _config = config
+    global _config_override
+    _config_override = config
+    get_config.cache_clear()
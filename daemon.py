@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+Long-running remix daemon that keeps one browser warm.
+
+Launching Chromium costs a few seconds per remix. `python cli.py serve`
+starts a daemon that launches it once and then accepts remix commands
+over a Unix socket, one JSON line per request:
+
+    {"op": "remix", "project_id": "...", "include_history": true}
+
+`cli.py ui-remix --yes` uses the daemon when its socket exists and falls
+back to launching its own browser otherwise.
+"""
+import json
+import socket
+import socketserver
+from dataclasses import asdict
+from pathlib import Path
+from typing import Optional, Dict, Any
+
+from rich.console import Console
+
+console = Console()
+
+# Unix socket the daemon listens on
+DAEMON_SOCKET = Path.home() / ".lovable" / "daemon.sock"
+
+# Client-side wait for a daemon reply (seconds) - a remix can take minutes
+DAEMON_REPLY_TIMEOUT = 300
+
+
+def send_request(payload: Dict[str, Any], socket_path: Path = DAEMON_SOCKET) -> Optional[Dict[str, Any]]:
+    """
+    Send one command to a running daemon.
+
+    Returns the decoded reply, or None if no daemon is listening. Once the
+    connection is made the request counts as delivered: any failure after
+    that (timeout, dropped connection, empty reply) is an error reply, so the
+    caller never runs the request a second time itself.
+    """
+    if not hasattr(socket, "AF_UNIX") or not socket_path.exists():
+        return None
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(DAEMON_REPLY_TIMEOUT)
+        try:
+            sock.connect(str(socket_path))
+        except OSError:
+            return None  # Stale socket file - no daemon behind it
+        try:
+            sock.sendall(json.dumps(payload).encode() + b"\n")
+            with sock.makefile("rb") as reply:
+                line = reply.readline()
+        except TimeoutError:  # socket.timeout
+            return _undelivered_reply(
+                f"No reply from the daemon within {DAEMON_REPLY_TIMEOUT}s "
+                "(it may be busy with earlier requests)"
+            )
+        except OSError as e:
+            return _undelivered_reply(f"Lost the connection to the daemon: {e}")
+    if not line:
+        return _undelivered_reply("The daemon closed the connection without replying")
+    return json.loads(line)
+
+
+def _undelivered_reply(error: str) -> Dict[str, Any]:
+    """Error reply for a request the daemon received but did not answer."""
+    return {"ok": False, "error": f"{error}; the remix may still complete - check 'status'"}
+
+
+def serve(socket_path: Path = DAEMON_SOCKET) -> int:
+    """
+    Run the daemon until interrupted.
+
+    Requests are handled one at a time on the main thread, which is the
+    thread that owns the (sync) Playwright browser.
+    """
+    from playwright.sync_api import sync_playwright
+    from config import get_config
+    from safety import get_safety_manager
+    from ui_remix import ui_remix, LAUNCH_ARGS
+
+    if not hasattr(socketserver, "UnixStreamServer"):
+        console.print("[red]The daemon needs Unix domain sockets (not available on this platform)[/red]")
+        return 1
+
+    config = get_config()
+    safety = get_safety_manager()
+
+    with sync_playwright() as p:
+        console.print("[blue]Launching browser...[/blue]")
+        browser = p.chromium.launch(headless=config.headless, args=LAUNCH_ARGS)
+
+        class Handler(socketserver.StreamRequestHandler):
+            def handle(self):
+                try:
+                    request = json.loads(self.rfile.readline())
+                    reply = _dispatch(request)
+                except Exception as e:
+                    reply = {"ok": False, "error": str(e)}
+                self.wfile.write(json.dumps(reply).encode() + b"\n")
+
+        def _dispatch(request: Dict[str, Any]) -> Dict[str, Any]:
+            if request.get("op") != "remix":
+                return {"ok": False, "error": f"Unknown op: {request.get('op')}"}
+            # Pick up remixes, resets and limits written by other processes since
+            # the last request, and save ours before replying
+            safety.reload()
+            try:
+                # The daemon has no terminal to prompt on - clients only forward --yes remixes
+                result = ui_remix(
+                    request["project_id"],
+                    include_history=request.get("include_history", True),
+                    skip_confirmation=True,
+                    safety=safety,
+                    browser=browser,
+                )
+            finally:
+                safety.flush()
+            return {"ok": True, "result": asdict(result) if result else None}
+
+        socket_path.parent.mkdir(parents=True, exist_ok=True)
+        socket_path.unlink(missing_ok=True)
+
+        try:
+            with socketserver.UnixStreamServer(str(socket_path), Handler) as server:
+                console.print(f"[green]✓ Daemon listening on {socket_path}[/green]")
+                console.print("[dim]Press Ctrl+C to stop[/dim]")
+                server.serve_forever()
+        except KeyboardInterrupt:
+            console.print("\n[yellow]Daemon stopped[/yellow]")
+        finally:
+            socket_path.unlink(missing_ok=True)
+            browser.close()
+
+    return 0
+
+
+if __name__ == "__main__":
+    import sys
+    sys.exit(serve())
@@ -1,157 +1,194 @@
 #!/usr/bin/env python3
 """
 Simplified diagnostic - uses direct "Remix this project" menu item.
+
+Usage:
+    python diagnose.py [project_id ...]
+
+Several project IDs are diagnosed concurrently in one browser.
 """
-from playwright.sync_api import sync_playwright
+from playwright.async_api import async_playwright, Browser, TimeoutError as PlaywrightTimeout
+import asyncio
+import os
 import sys
-import time
 import re
+from typing import Optional
 
-PROJECT_ID = sys.argv[1] if len(sys.argv) > 1 else "65a49f56-9201-4dfc-a559-817c90e2a853"
-SESSION_FILE = "session_state/lovable_session.json"
+from config import extract_project_id
 
-def extract_project_id(url: str):
-    match = re.search(r'/projects/([a-f0-9-]+)', url)
-    return match.group(1) if match else None
+DEFAULT_PROJECT_ID = "65a49f56-9201-4dfc-a559-817c90e2a853"
+SESSION_FILE = "session_state/lovable_session.json"
 
-print(f"Starting diagnosis for project: {PROJECT_ID}")
-print("=" * 60)
 
-with sync_playwright() as p:
-    print("1. Launching browser...")
-    browser = p.chromium.launch(headless=False, slow_mo=50)
-    print("   ✓ Browser launched")
+def new_project_url_re(project_id: str) -> re.Pattern:
+    """Match any project URL other than the source project (i.e. the new remix)."""
+    return re.compile(rf"lovable\.dev/projects/(?!{re.escape(project_id)})([a-f0-9-]+)")
 
-    print("2. Creating context with session...")
-    context = browser.new_context(storage_state=SESSION_FILE)
-    print("   ✓ Context created")
 
-    print("3. Opening new page...")
-    page = context.new_page()
-    print("   ✓ Page opened")
+async def diagnose(browser: Browser, project_id: str, prefix: str = "") -> Optional[str]:
+    """Run the remix flow for one project and return the new project ID, if any."""
+    def log(message: str = "") -> None:
+        print(f"{prefix}{message}")
 
-    print(f"4. Navigating to project...")
-    page.goto(f"https://lovable.dev/projects/{PROJECT_ID}", wait_until="domcontentloaded")
-    print("   ✓ DOM content loaded")
+    new_project_url = new_project_url_re(project_id)
 
-    print("5. Waiting for page to be ready...")
-    page.wait_for_timeout(3000)
-    print("   ✓ Page ready")
+    log(f"Starting diagnosis for project: {project_id}")
+    log("=" * 60)
 
-    print("6. Current URL:", page.url)
+    log("2. Creating context with session...")
+    context = await browser.new_context(storage_state=SESSION_FILE)
+    log("   ✓ Context created")
 
-    # STEP A: Click project menu button
-    print("\n" + "=" * 60)
-    print("STEP A: Opening project menu...")
-    print("=" * 60)
+    try:
+        log("3. Opening new page...")
+        page = await context.new_page()
+        log("   ✓ Page opened")
+
+        log(f"4. Navigating to project...")
+        await page.goto(f"https://lovable.dev/projects/{project_id}", wait_until="domcontentloaded")
+        log("   ✓ DOM content loaded")
+
+        log("5. Waiting for page to be ready...")
+        await page.wait_for_selector("button[aria-haspopup='menu']", state="visible", timeout=10000)
+        log("   ✓ Page ready")
+
+        log(f"6. Current URL: {page.url}")
+
+        # STEP A: Click project menu button
+        log("\n" + "=" * 60)
+        log("STEP A: Opening project menu...")
+        log("=" * 60)
+
+        menu_button = page.locator("button[aria-haspopup='menu']").first
+        await menu_button.click()
+        await page.wait_for_selector("[role='menuitem']", state="visible")
+        log("   ✓ Menu opened")
+
+        # STEP B: Click "Remix this project" directly
+        log("\n" + "=" * 60)
+        log("STEP B: Clicking 'Remix this project'...")
+        log("=" * 60)
+
+        # List menu items to confirm (all texts read in one round-trip)
+        menu_items = page.locator("[role='menuitem']")
+        menu_texts = await menu_items.evaluate_all("els => els.map(e => e.innerText.trim())")
+        log(f"   Found {len(menu_texts)} menu items")
+
+        remix_item = None
+        for i, text in enumerate(menu_texts):
+            if remix_item is None and "remix" in text.lower():
+                log(f"   [{i}] '{text}' <- FOUND REMIX")
+                remix_item = menu_items.nth(i)
+            else:
+                log(f"   [{i}] '{text}'")
 
-    menu_button = page.locator("button[aria-haspopup='menu']").first
-    menu_button.click()
-    page.wait_for_timeout(500)
-    print("   ✓ Menu opened")
+        if remix_item is None:
+            log("   ✗ No remix menu item found!")
+            return None
 
-    # STEP B: Click "Remix this project" directly
-    print("\n" + "=" * 60)
-    print("STEP B: Clicking 'Remix this project'...")
-    print("=" * 60)
+        log("\n   Clicking 'Remix this project'...")
+        await remix_item.click()
+        log("   ✓ Clicked!")
 
-    # List menu items to confirm
-    menu_items = page.locator("[role='menuitem']").all()
-    print(f"   Found {len(menu_items)} menu items")
+        # STEP C: Handle any dialog that appears
+        log("\n" + "=" * 60)
+        log("STEP C: Checking for confirmation dialog...")
+        log("=" * 60)
 
-    remix_item = None
-    for i, item in enumerate(menu_items):
         try:
-            text = item.inner_text(timeout=500).strip()
-            if "remix" in text.lower():
-                print(f"   [{i}] '{text}' <- FOUND REMIX")
-                remix_item = item
+            await page.wait_for_selector("[role='dialog']", state="visible", timeout=3000)
+        except PlaywrightTimeout:
+            pass  # Reported below
+
+        # Check if a dialog appeared
+        dialog = page.locator("[role='dialog']")
+        if await dialog.is_visible(timeout=2000):
+            log("   ✓ Dialog appeared")
+
+            # Look for confirm button
+            button_texts = await page.locator("[role='dialog'] button").evaluate_all(
+                "els => els.map(e => e.innerText.trim())"
+            )
+            log(f"   Found {len(button_texts)} buttons in dialog:")
+
+            for i, text in enumerate(button_texts):
+                log(f"      [{i}] '{text}'")
+
+            # Find and click the Remix/Confirm button
+            confirm_btn = page.locator("[role='dialog'] button:has-text('Remix')").first
+            if await confirm_btn.is_visible(timeout=1000):
+                log("\n   Clicking confirm button...")
+                await confirm_btn.click()
+                log("   ✓ Confirmed!")
             else:
-                print(f"   [{i}] '{text}'")
-        except:
-            pass
-
-    if remix_item is None:
-        print("   ✗ No remix menu item found!")
-        browser.close()
-        sys.exit(1)
-
-    print("\n   Clicking 'Remix this project'...")
-    remix_item.click()
-    print("   ✓ Clicked!")
-
-    # STEP C: Handle any dialog that appears
-    print("\n" + "=" * 60)
-    print("STEP C: Checking for confirmation dialog...")
-    print("=" * 60)
-
-    page.wait_for_timeout(1000)
+                log("   No confirm button needed")
+        else:
+            log("   No dialog appeared - remix may start directly")
 
-    # Check if a dialog appeared
-    dialog = page.locator("[role='dialog']")
-    if dialog.is_visible(timeout=2000):
-        print("   ✓ Dialog appeared")
+        # STEP D: Wait for new project
+        log("\n" + "=" * 60)
+        log("STEP D: Waiting for new project...")
+        log("=" * 60)
 
-        # Look for confirm button
-        dialog_buttons = page.locator("[role='dialog'] button").all()
-        print(f"   Found {len(dialog_buttons)} buttons in dialog:")
+        log(f"   Original project ID: {project_id}")
+        new_project_id = None
 
-        for i, btn in enumerate(dialog_buttons):
+        # Use wait_for_url - this worked before
+        log("   Using Playwright wait_for_url...")
+        try:
+            await page.wait_for_url(new_project_url, timeout=120000)  # 2 minutes
+            new_project_id = extract_project_id(page.url)
+            log(f"   ✓ URL changed to: {page.url}")
+            log(f"   ✓ New project ID: {new_project_id}")
+        except Exception as e:
+            log(f"   wait_for_url exception: {e}")
+            # Fallback: check current URL
             try:
-                text = btn.inner_text(timeout=500).strip()
-                print(f"      [{i}] '{text}'")
+                current_url = page.url
+                current_id = extract_project_id(current_url)
+                log(f"   Fallback check - URL: {current_url}")
+                if current_id and current_id != project_id:
+                    new_project_id = current_id
+                    log(f"   ✓ Found new project: {new_project_id}")
             except:
                 pass
 
-        # Find and click the Remix/Confirm button
-        confirm_btn = page.locator("[role='dialog'] button:has-text('Remix')").first
-        if confirm_btn.is_visible(timeout=1000):
-            print("\n   Clicking confirm button...")
-            confirm_btn.click()
-            print("   ✓ Confirmed!")
+        if new_project_id:
+            log(f"\n   ✓ SUCCESS!")
+            log(f"   New project URL: https://lovable.dev/projects/{new_project_id}")
         else:
-            print("   No confirm button needed")
-    else:
-        print("   No dialog appeared - remix may start directly")
+            log(f"\n   ✗ Could not detect new project")
+
+        log("\n" + "=" * 60)
+        log("COMPLETE")
+        log("=" * 60)
+        return new_project_id
+    finally:
+        await context.close()
+
+
+async def main(project_ids: list[str]) -> int:
+    """Diagnose all projects concurrently, sharing one browser."""
+    async with async_playwright() as p:
+        print("1. Launching browser...")
+        # Headless and no slow-mo unless asked for (HEADLESS=false SLOW_MO=50 to watch)
+        browser = await p.chromium.launch(
+            headless=os.getenv("HEADLESS", "true").lower() == "true",
+            slow_mo=int(os.getenv("SLOW_MO", "0")),
+        )
+        print("   ✓ Browser launched")
 
-    # STEP D: Wait for new project
-    print("\n" + "=" * 60)
-    print("STEP D: Waiting for new project...")
-    print("=" * 60)
+        try:
+            # Prefix output lines with the project when several runs interleave
+            results = await asyncio.gather(*(
+                diagnose(browser, pid, f"[{pid[:8]}] " if len(project_ids) > 1 else "")
+                for pid in project_ids
+            ))
+        finally:
+            await browser.close()
 
-    print(f"   Original project ID: {PROJECT_ID}")
-    new_project_id = None
+    return 0 if all(results) else 1
 
-    # Use wait_for_url - this worked before
-    print("   Using Playwright wait_for_url...")
-    try:
-        page.wait_for_url(
-            re.compile(rf"lovable\.dev/projects/(?!{PROJECT_ID})([a-f0-9-]+)"),
-            timeout=120000  # 2 minutes
-        )
-        new_project_id = extract_project_id(page.url)
-        print(f"   ✓ URL changed to: {page.url}")
-        print(f"   ✓ New project ID: {new_project_id}")
-    except Exception as e:
-        print(f"   wait_for_url exception: {e}")
-        # Fallback: check current URL
-        try:
-            current_url = page.url
-            current_id = extract_project_id(current_url)
-            print(f"   Fallback check - URL: {current_url}")
-            if current_id and current_id != PROJECT_ID:
-                new_project_id = current_id
-                print(f"   ✓ Found new project: {new_project_id}")
-        except:
-            pass
-
-    if new_project_id:
-        print(f"\n   ✓ SUCCESS!")
-        print(f"   New project URL: https://lovable.dev/projects/{new_project_id}")
-    else:
-        print(f"\n   ✗ Could not detect new project")
-
-    print("\n" + "=" * 60)
-    print("COMPLETE")
-    print("=" * 60)
-    browser.close()
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main(sys.argv[1:] or [DEFAULT_PROJECT_ID])))
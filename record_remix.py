@@ -18,14 +18,31 @@ import json
 import subprocess
 import sys
 from pathlib import Path
+from typing import Optional
 from rich.console import Console
 from rich.panel import Panel
+from rich.syntax import Syntax
 
 from config import get_config
 
 console = Console()
 
 
+def _codegen_command(*args: str) -> tuple[list, Optional[dict]]:
+    """
+    Build the `playwright codegen` command and its environment.
+
+    Runs the Playwright driver directly when possible, skipping the extra
+    Python interpreter that `python -m playwright` would start first.
+    """
+    try:
+        from playwright._impl._driver import compute_driver_executable, get_driver_env
+        driver_executable, driver_cli = compute_driver_executable()
+        return [driver_executable, driver_cli, "codegen", *args], get_driver_env()
+    except Exception:
+        return [sys.executable, "-m", "playwright", "codegen", *args], None
+
+
 def record_remix(project_id: str):
     """
     Open browser for recording a remix action.
@@ -56,19 +73,18 @@ def record_remix(project_id: str):
     input("\nPress Enter to start recording...")
 
     # Use Playwright codegen with saved session
-    cmd = [
-        sys.executable, "-m", "playwright", "codegen",
+    cmd, env = _codegen_command(
         "--target", "python",
         "--output", str(output_file),
         "--load-storage", str(session_file),
         project_url,
-    ]
+    )
 
     console.print(f"\n[blue]Starting Playwright codegen...[/blue]")
     console.print(f"[dim]Command: {' '.join(cmd)}[/dim]\n")
 
     try:
-        result = subprocess.run(cmd)
+        result = subprocess.run(cmd, env=env)
 
         if output_file.exists():
             console.print(Panel(
@@ -82,7 +98,7 @@ def record_remix(project_id: str):
 
             # Show the generated code
             console.print("\n[bold]Generated code:[/bold]")
-            console.print(output_file.read_text())
+            console.print(Syntax.from_path(str(output_file), lexer="python"))
         else:
             console.print("[yellow]No recording saved (browser closed without actions?)[/yellow]")
 
@@ -1,9 +1,13 @@
+import os
 import re
 from playwright.sync_api import Playwright, sync_playwright, expect
 
 
 def run(playwright: Playwright) -> None:
-    browser = playwright.chromium.launch(headless=False)
+    browser = playwright.chromium.launch(
+        headless=os.getenv("HEADLESS", "true").lower() == "true",
+        slow_mo=int(os.getenv("SLOW_MO", "0")),
+    )
     context = browser.new_context(storage_state="session_state/lovable_session.json")
     page = context.new_page()
     page.goto("https://lovable.dev/projects/65a49f56-9201-4dfc-a559-817c90e2a853")
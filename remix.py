@@ -17,18 +17,23 @@ Safety features integrated:
 """
 import sys
 import json
+import time
 from datetime import datetime
 from pathlib import Path
 from typing import Optional, Dict, Any
 from dataclasses import dataclass, asdict
 from rich.console import Console
 from rich.panel import Panel
-from rich.table import Table
+
+try:
+    import orjson
+except ImportError:  # Optional - falls back to the stdlib encoder
+    orjson = None
 
 from config import LovableConfig, get_config, set_config
 from auth import get_or_refresh_token, LovableAuth
 from api import LovableAPI, RemixResult
-from safety import get_safety_manager
+from safety import get_safety_manager, SafetyManager
 
 console = Console()
 
@@ -70,9 +75,23 @@ def create_remix(
         RemixWorkflowResult with success status and new project details,
         or None if blocked by safety checks
     """
-    config = config or get_config()
-    safety = get_safety_manager()
+    return _do_remix(
+        source_project_id,
+        include_history,
+        skip_confirmation,
+        config or get_config(),
+        get_safety_manager(),
+    )
+
 
+def _do_remix(
+    source_project_id: str,
+    include_history: bool,
+    skip_confirmation: bool,
+    config: LovableConfig,
+    safety: SafetyManager,
+) -> Optional[RemixWorkflowResult]:
+    """Run the remix workflow with an already resolved config and safety manager."""
     console.print(Panel(
         f"[bold]Creating Remix[/bold]\n"
         f"Source: {source_project_id}\n"
@@ -101,14 +120,18 @@ def create_remix(
     api = LovableAPI(token, config, safety)
     console.print("[green]✓ API client ready with safety checks[/green]")
 
-    # Step 3: Optionally verify source project (may not work if endpoint doesn't exist)
-    console.print("\n[bold]Step 3: Verify Source Project[/bold]")
-    source_project = api.get_project(source_project_id)
-    if source_project:
-        console.print(f"[green]✓ Source project found: {source_project.name}[/green]")
+    # Step 3: Optionally verify source project (may not work if endpoint doesn't exist).
+    # Off by default - it costs a request and a rate limit token per remix.
+    if config.verify_source:
+        console.print("\n[bold]Step 3: Verify Source Project[/bold]")
+        source_project = api.get_project(source_project_id)
+        if source_project:
+            console.print(f"[green]✓ Source project found: {source_project.name}[/green]")
+        else:
+            console.print("[yellow]⚠ Could not verify source project (endpoint may not exist)[/yellow]")
+            console.print("[yellow]  Proceeding with remix attempt...[/yellow]")
     else:
-        console.print("[yellow]⚠ Could not verify source project (endpoint may not exist)[/yellow]")
-        console.print("[yellow]  Proceeding with remix attempt...[/yellow]")
+        console.print("\n[dim]Step 3: Source verification skipped (set VERIFY_SOURCE=true to enable)[/dim]")
 
     # Step 4: Create remix (safety checks happen inside api.remix_project)
     console.print("\n[bold]Step 4: Create Remix[/bold]")
@@ -172,10 +195,14 @@ def _save_result(result: RemixWorkflowResult) -> None:
     results_dir = Path("results")
     results_dir.mkdir(exist_ok=True)
 
-    filename = f"remix_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+    # Nanosecond timestamp: sortable, and unique even for back-to-back results
+    filename = f"remix_{time.time_ns()}.json"
     result_file = results_dir / filename
 
-    result_file.write_text(json.dumps(asdict(result), indent=2))
+    if orjson is not None:
+        result_file.write_bytes(orjson.dumps(result, option=orjson.OPT_INDENT_2))
+    else:
+        result_file.write_text(json.dumps(asdict(result), indent=2))
     console.print(f"[dim]Result saved to: {result_file}[/dim]")
 
 
@@ -210,15 +237,17 @@ def interactive_remix() -> Optional[RemixWorkflowResult]:
         )
 
         # Handle URL or ID
+        project_id = None
         if "lovable.dev/projects/" in project_input:
             parts = project_input.rstrip("/").split("/")
             if "projects" in parts:
                 idx = parts.index("projects")
                 if idx + 1 < len(parts):
-                    config.project_id = parts[idx + 1]
+                    project_id = parts[idx + 1]
         else:
-            config.project_id = project_input.strip()
+            project_id = project_input.strip()
 
+        config = config.model_copy(update={"project_id": project_id})
         set_config(config)
 
     # Confirm (this is in addition to the safety confirmation)
@@ -232,7 +261,13 @@ def interactive_remix() -> Optional[RemixWorkflowResult]:
         )
 
     # Note: skip_confirmation=False means the safety check will also ask for confirmation
-    return create_remix(config.project_id, skip_confirmation=False)
+    return _do_remix(
+        config.project_id,
+        include_history=False,
+        skip_confirmation=False,
+        config=config,
+        safety=safety,
+    )
 
 
 if __name__ == "__main__":
@@ -9,25 +9,46 @@ Implements:
 5. Confirmation prompts - requires explicit user consent
 6. Audit logging - records all operations for review
 """
+import asyncio
+import atexit
+import hashlib
 import json
+import os
+import queue
+import re
+import tempfile
+import threading
 import time
-from datetime import datetime, timedelta
+from collections import deque
+from datetime import date, datetime
 from pathlib import Path
 from typing import Optional, Dict, Any, Callable
-from dataclasses import dataclass, field, asdict
-from functools import wraps
-from rich.console import Console
-from rich.panel import Panel
+from dataclasses import dataclass, field
+from functools import lru_cache, wraps
 
-console = Console()
+try:
+    import orjson
+except ImportError:  # Optional - falls back to the stdlib json module
+    orjson = None
+
+# rich (and config/pydantic) are imported on first use, so library callers that
+# only check limits or retries don't pay for them at import time
+
+
+@lru_cache(maxsize=None)
+def _console():
+    """Shared Rich console, created on first use."""
+    from rich.console import Console
+    return Console()
 
 
 # =============================================================================
 # Configuration Constants - Tuned for safety
 # =============================================================================
 
-# Rate limiting
-MIN_REQUEST_INTERVAL_SECONDS = 2.0  # Minimum time between API requests
+# Rate limiting (token bucket)
+MIN_REQUEST_INTERVAL_SECONDS = 2.0  # Average time between API requests (one token per interval)
+RATE_LIMIT_BURST = 6  # Bucket capacity - requests allowed back-to-back before throttling
 MAX_REQUESTS_PER_MINUTE = 10  # Hard limit on requests per minute
 MAX_REQUESTS_PER_HOUR = 60  # Hard limit on requests per hour
 
@@ -39,10 +60,29 @@ CIRCUIT_BREAKER_RESET_MINUTES = 15  # Wait this long before retrying after circu
 MAX_RETRIES = 2  # Maximum retry attempts
 RETRY_BACKOFF_BASE = 2.0  # Exponential backoff base (seconds)
 RETRY_BACKOFF_MAX = 30.0  # Maximum backoff delay
+_RETRY_DELAYS = tuple(  # Backoff per attempt, precomputed (attempts are bounded by MAX_RETRIES)
+    min(RETRY_BACKOFF_BASE ** attempt, RETRY_BACKOFF_MAX) for attempt in range(MAX_RETRIES + 2)
+)
+_NO_RETRY_RE = re.compile(r"403|401|404|already remixed|supabase", re.IGNORECASE)  # Errors not worth retrying
 
 # Session limits
 MAX_OPERATIONS_PER_SESSION = 10  # Warn after this many operations
 MAX_REMIXES_PER_DAY = 20  # Hard limit on daily remixes
+MAX_REMIX_HISTORY = 10_000  # Idempotency entries kept (oldest dropped first)
+NS_PER_SECOND = 1_000_000_000
+SECONDS_PER_DAY = 86400  # Daily counters reset at UTC midnight
+_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()  # For converting dates to day numbers
+
+# State persistence - request records are batched instead of saved per request
+STATE_FLUSH_INTERVAL_SECONDS = 1.0  # Max age of unsaved request records
+STATE_FLUSH_MAX_PENDING = 64  # Save once this many request records are pending
+STATE_WRITE_WAIT_SECONDS = 5.0  # Max wait for the writer thread on synchronous saves
+REQUEST_LOG_SIZE = 100  # Audit log entries kept (oldest dropped first)
+
+# Rate limit tokens charged per operation (default 1)
+OPERATION_COSTS = {
+    "remix": 3,
+}
 
 
 # =============================================================================
@@ -67,19 +107,81 @@ class SafetyState:
     remixes_today: int = 0
     last_request_time: Optional[str] = None
     consecutive_failures: int = 0
-    circuit_breaker_until: Optional[str] = None
-    last_reset_date: str = ""
-    request_log: list = field(default_factory=list)
-    remix_history: Dict[str, str] = field(default_factory=dict)  # project_id -> remix_id
+    circuit_breaker_until_ns: Optional[int] = None  # Epoch nanoseconds
+    last_reset_day: int = 0  # Days since the Unix epoch (UTC) of the last daily reset
+    request_log: deque = field(default_factory=lambda: deque(maxlen=REQUEST_LOG_SIZE))
+    remix_history: Dict[str, str] = field(default_factory=dict)  # remix_key() -> remix_id
 
     def to_dict(self) -> dict:
-        return asdict(self)
+        # Shallow copy - asdict() would deep-copy every log entry on each save
+        return {
+            "requests_today": self.requests_today,
+            "remixes_today": self.remixes_today,
+            "last_request_time": self.last_request_time,
+            "consecutive_failures": self.consecutive_failures,
+            "circuit_breaker_until_ns": self.circuit_breaker_until_ns,
+            "last_reset_day": self.last_reset_day,
+            "request_log": list(self.request_log),  # deque is not JSON serializable
+            "remix_history": dict(self.remix_history),
+        }
 
     @classmethod
     def from_dict(cls, data: dict) -> "SafetyState":
+        # Fresh containers, so states built from the same parsed data stay independent
+        data = dict(data)
+        data["request_log"] = deque(data.get("request_log", ()), maxlen=REQUEST_LOG_SIZE)
+        data["remix_history"] = dict(data.get("remix_history", {}))
+        legacy_date = data.pop("last_reset_date", None)  # Older files store "YYYY-MM-DD"
+        if legacy_date and "last_reset_day" not in data:
+            data["last_reset_day"] = date.fromisoformat(legacy_date).toordinal() - _EPOCH_ORDINAL
+        legacy_breaker = data.pop("circuit_breaker_until", None)  # Older files store an ISO time
+        if legacy_breaker and "circuit_breaker_until_ns" not in data:
+            data["circuit_breaker_until_ns"] = int(datetime.fromisoformat(legacy_breaker).timestamp() * NS_PER_SECOND)
         return cls(**data)
 
 
+# Parsed state files: path -> ((mtime_ns, size), data). An unchanged file is not re-read.
+_state_cache: Dict[Path, tuple] = {}
+
+
+def _dumps(data: dict) -> bytes:
+    """Encode state as compact JSON, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, separators=(",", ":")).encode()
+
+
+def _loads(raw: bytes) -> dict:
+    """Decode state JSON, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def remix_key(project_id: str, include_history: bool) -> str:
+    """
+    Idempotency key for a remix: the same project with the same options on the
+    same (UTC) day. A different history option or a later day is a new remix.
+    """
+    day = int(time.time() // SECONDS_PER_DAY)
+    raw = f"{project_id}|{bool(include_history)}|{day}".encode()
+    return hashlib.blake2b(raw, digest_size=16).hexdigest()
+
+
+def _epoch(iso_time: Optional[str]) -> Optional[float]:
+    """Convert a persisted ISO timestamp to epoch seconds."""
+    return datetime.fromisoformat(iso_time).timestamp() if iso_time else None
+
+
+def _file_signature(path: Path) -> Optional[tuple]:
+    """Return (mtime_ns, size) for a file, or None if it does not exist."""
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
 # =============================================================================
 # Safety Manager
 # =============================================================================
@@ -92,36 +194,199 @@ class SafetyManager:
     every action before it's executed.
     """
 
-    def __init__(self, state_file: Optional[Path] = None):
+    def __init__(self, state_file: Optional[Path] = None, verbose: Optional[bool] = None):
         self.state_file = state_file or Path("session_state/safety_state.json")
+        # Routine progress notes are only printed in verbose mode (VERBOSE=true);
+        # blocks, warnings about failures and prompts are always shown
+        if verbose is None:
+            from config import get_config
+            verbose = get_config().verbose
+        self._verbose = verbose
         self.state = self._load_state()
+        # Hot-path time as an epoch float; the ISO string is only for the state file
+        self._last_request_at = _epoch(self.state.last_request_time)
+        # State snapshots are written by a background thread, off the request path
+        self._persist_queue = queue.SimpleQueue()
+        threading.Thread(target=self._writer_loop, name="safety-state-writer", daemon=True).start()
+        self._pending_records = 0
+        self._last_flush = time.monotonic()
+        self._dirty = False  # Unsaved changes from checks, written by _maybe_save()
         self._check_daily_reset()
+        self._maybe_save()
+        self._tokens, self._last_refill = self._initial_tokens()
+        self._bucket_lock = threading.Lock()
+        atexit.register(self.flush)
 
     def _load_state(self) -> SafetyState:
-        """Load safety state from file."""
-        if self.state_file.exists():
-            try:
-                data = json.loads(self.state_file.read_text())
-                return SafetyState.from_dict(data)
-            except Exception as e:
-                console.print(f"[yellow]Warning: Could not load safety state: {e}[/yellow]")
-        return SafetyState()
-
-    def _save_state(self) -> None:
-        """Persist safety state to file."""
+        """Load safety state from file (parsed once per file version)."""
+        signature = _file_signature(self.state_file)
+        self._state_signature = signature  # File version this manager's state is based on
+        if signature is None:
+            return SafetyState()
+        cached = _state_cache.get(self.state_file)
+        if cached is not None and cached[0] == signature:
+            return SafetyState.from_dict(cached[1])
+        try:
+            data = _loads(self.state_file.read_bytes())
+            state = SafetyState.from_dict(data)
+        except Exception as e:
+            _console().print(f"[yellow]Warning: Could not load safety state: {e}[/yellow]")
+            return SafetyState()
+        _state_cache[self.state_file] = (signature, data)
+        return state
+
+    def _save_state(self, wait: bool = False) -> None:
+        """
+        Queue a snapshot of the safety state for the writer thread.
+
+        With wait=True, block until it is on disk (for state other
+        processes must see right away).
+        """
+        if self._last_request_at is not None:
+            self.state.last_request_time = datetime.fromtimestamp(self._last_request_at).isoformat()
+        self._persist_queue.put(self.state.to_dict())
+        self._pending_records = 0
+        self._dirty = False
+        self._last_flush = time.monotonic()
+        if wait:
+            self._wait_for_writer()
+
+    def _wait_for_writer(self) -> None:
+        """Block until every snapshot queued so far has been written."""
+        written = threading.Event()
+        self._persist_queue.put(written)
+        written.wait(STATE_WRITE_WAIT_SECONDS)
+
+    def _writer_loop(self) -> None:
+        """Write queued snapshots, coalescing a backlog into one write of the latest."""
+        while True:
+            items = [self._persist_queue.get()]
+            while True:
+                try:
+                    items.append(self._persist_queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            snapshots = [item for item in items if isinstance(item, dict)]
+            if snapshots:
+                try:
+                    self._write_state(snapshots[-1])
+                except Exception as e:
+                    _console().print(f"[yellow]Warning: Could not save safety state: {e}[/yellow]")
+
+            for item in items:
+                if isinstance(item, threading.Event):
+                    item.set()
+
+    def _write_state(self, data: dict) -> None:
+        """Write a state snapshot to file (atomically - a crash never leaves a torn file)."""
         self.state_file.parent.mkdir(parents=True, exist_ok=True)
-        self.state_file.write_text(json.dumps(self.state.to_dict(), indent=2))
+        # A temp file of our own - other processes (the daemon, CLI runs) save
+        # the same state file concurrently
+        with tempfile.NamedTemporaryFile(
+            dir=self.state_file.parent, prefix=f"{self.state_file.name}.", suffix=".tmp", delete=False,
+        ) as tmp:
+            try:
+                # Compact encoding - the file is machine state, and a smaller
+                # snapshot means less to encode and write on every flush
+                tmp.write(_dumps(data))
+                tmp.flush()
+                os.fsync(tmp.fileno())
+            except BaseException:
+                tmp.close()
+                os.unlink(tmp.name)
+                raise
+        try:
+            os.replace(tmp.name, self.state_file)
+        except BaseException:
+            os.unlink(tmp.name)
+            raise
+        self._state_signature = _file_signature(self.state_file)
+        _state_cache[self.state_file] = (self._state_signature, data)
+
+    def _maybe_save(self) -> None:
+        """Save once if checks changed the state."""
+        if self._dirty:
+            self._save_state()
+
+    def _maybe_flush(self) -> None:
+        """Save buffered request records once enough are pending or they get old."""
+        if (self._pending_records >= STATE_FLUSH_MAX_PENDING
+                or time.monotonic() - self._last_flush >= STATE_FLUSH_INTERVAL_SECONDS):
+            self._save_state()
+
+    def flush(self) -> None:
+        """Save any buffered request records and wait until they are on disk."""
+        if self._pending_records or self._dirty:
+            self._save_state()
+        self._wait_for_writer()
+
+    def reset(self) -> None:
+        """
+        Clear all counters, history and the circuit breaker, and wait until the
+        cleared state is on disk. Goes through the writer queue, so no snapshot
+        queued earlier can land afterwards and bring the old state back.
+        """
+        self.state = SafetyState(last_reset_day=int(time.time() // SECONDS_PER_DAY))
+        self._last_request_at = None
+        self._save_state(wait=True)
+
+    def reload(self) -> bool:
+        """
+        Re-read the state file if another process changed it since this manager
+        last read or wrote it. For long-running processes (the daemon), which
+        would otherwise overwrite other processes' remixes and resets.
+
+        Local changes not yet saved are kept instead (call flush() first).
+        Returns True if the state was reloaded.
+        """
+        if self._pending_records or self._dirty:
+            return False
+        self._wait_for_writer()  # Our own queued writes must not look like someone else's
+        if _file_signature(self.state_file) == self._state_signature:
+            return False
+        self.state = self._load_state()
+        self._last_request_at = _epoch(self.state.last_request_time)
+        return True
+
+    def _initial_tokens(self) -> tuple[float, float]:
+        """Seed the token bucket from the last persisted request time."""
+        tokens = float(RATE_LIMIT_BURST)
+        if self._last_request_at is not None:
+            elapsed = time.time() - self._last_request_at
+            tokens = min(tokens, max(elapsed, 0.0) / MIN_REQUEST_INTERVAL_SECONDS)
+        return tokens, time.monotonic()
+
+    def _reserve_tokens(self, cost: float) -> float:
+        """
+        Take `cost` tokens from the bucket.
+
+        The balance may go negative; the returned delay (seconds) is how long
+        the caller must wait until the reserved tokens have been earned.
+        """
+        with self._bucket_lock:
+            self._refill_tokens()
+            self._tokens -= cost
+            return max(0.0, -self._tokens) * MIN_REQUEST_INTERVAL_SECONDS
+
+    def _refill_tokens(self) -> None:
+        """Add the tokens earned since the last refill, up to the burst capacity."""
+        now = time.monotonic()
+        elapsed = now - self._last_refill
+        self._tokens = min(RATE_LIMIT_BURST, self._tokens + elapsed / MIN_REQUEST_INTERVAL_SECONDS)
+        self._last_refill = now
 
     def _check_daily_reset(self) -> None:
-        """Reset daily counters if it's a new day."""
-        today = datetime.now().strftime("%Y-%m-%d")
-        if self.state.last_reset_date != today:
-            console.print(f"[dim]New day detected, resetting daily counters[/dim]")
+        """Reset daily counters if it's a new (UTC) day."""
+        today = int(time.time() // SECONDS_PER_DAY)
+        if self.state.last_reset_day != today:
+            if self._verbose:
+                _console().print(f"[dim]New day detected, resetting daily counters[/dim]")
             self.state.requests_today = 0
             self.state.remixes_today = 0
-            self.state.last_reset_date = today
-            self.state.request_log = []  # Clear old logs
-            self._save_state()
+            self.state.last_reset_day = today
+            self.state.request_log.clear()  # Clear old logs
+            self._dirty = True
 
     def _log_request(self, operation: str, endpoint: str, success: bool,
                      error: Optional[str] = None, response_code: Optional[int] = None) -> None:
@@ -134,13 +399,15 @@ class SafetyManager:
             error=error,
             response_code=response_code,
         )
-        self.state.request_log.append(asdict(log_entry))
-
-        # Keep only last 100 log entries
-        if len(self.state.request_log) > 100:
-            self.state.request_log = self.state.request_log[-100:]
-
-        self._save_state()
+        # The entry is fresh and never mutated, so its __dict__ is stored as is.
+        # Unset optional fields are left out of the record (readers use .get()).
+        entry = vars(log_entry)
+        if error is None:
+            del entry["error"]
+        if response_code is None:
+            del entry["response_code"]
+        # Bounded deque - the oldest entry is dropped once the log is full
+        self.state.request_log.append(entry)
 
     # =========================================================================
     # Safety Checks
@@ -153,15 +420,13 @@ class SafetyManager:
         Returns:
             Tuple of (allowed, reason)
         """
-        now = datetime.now()
-
-        # Check minimum interval
-        if self.state.last_request_time:
-            last_time = datetime.fromisoformat(self.state.last_request_time)
-            elapsed = (now - last_time).total_seconds()
-            if elapsed < MIN_REQUEST_INTERVAL_SECONDS:
-                wait_time = MIN_REQUEST_INTERVAL_SECONDS - elapsed
-                return False, f"Rate limit: wait {wait_time:.1f}s before next request"
+        # Check token bucket
+        with self._bucket_lock:
+            self._refill_tokens()
+            tokens = self._tokens
+        if tokens < 1:
+            wait_time = (1 - tokens) * MIN_REQUEST_INTERVAL_SECONDS
+            return False, f"Rate limit: wait {wait_time:.1f}s before next request"
 
         # Check hourly limit
         if self.state.requests_today >= MAX_REQUESTS_PER_HOUR:
@@ -176,16 +441,16 @@ class SafetyManager:
         Returns:
             Tuple of (allowed, reason)
         """
-        if self.state.circuit_breaker_until:
-            reset_time = datetime.fromisoformat(self.state.circuit_breaker_until)
-            if datetime.now() < reset_time:
-                remaining = (reset_time - datetime.now()).total_seconds() / 60
-                return False, f"Circuit breaker active: {remaining:.1f} minutes until reset"
+        until_ns = self.state.circuit_breaker_until_ns
+        if until_ns is not None:
+            remaining_ns = until_ns - time.time_ns()
+            if remaining_ns > 0:
+                return False, f"Circuit breaker active: {remaining_ns / (60 * NS_PER_SECOND):.1f} minutes until reset"
             else:
                 # Reset circuit breaker
-                self.state.circuit_breaker_until = None
+                self.state.circuit_breaker_until_ns = None
                 self.state.consecutive_failures = 0
-                self._save_state()
+                self._dirty = True
 
         return True, ""
 
@@ -201,7 +466,8 @@ class SafetyManager:
 
         return True, ""
 
-    def check_idempotency(self, operation: str, project_id: str) -> tuple[bool, Optional[str]]:
+    def check_idempotency(self, operation: str, project_id: str,
+                          include_history: bool = False) -> tuple[bool, Optional[str]]:
         """
         Check if operation was already performed.
 
@@ -209,7 +475,7 @@ class SafetyManager:
             Tuple of (is_new, existing_result_id)
         """
         if operation == "remix":
-            existing = self.state.remix_history.get(project_id)
+            existing = self.state.remix_history.get(remix_key(project_id, include_history))
             if existing:
                 return False, existing
 
@@ -220,24 +486,83 @@ class SafetyManager:
     # =========================================================================
 
     def pre_operation_check(self, operation: str, project_id: Optional[str] = None,
-                            skip_confirmation: bool = False) -> tuple[bool, str]:
+                            skip_confirmation: bool = False,
+                            include_history: bool = False,
+                            rate_limit: bool = True) -> tuple[bool, str]:
         """
         Comprehensive pre-operation safety check.
 
         This is the main gate that must be passed before any operation.
+        With rate_limit=False no rate limit tokens are taken - for callers that
+        approve several operations up front and take each one's tokens
+        (OPERATION_COSTS) right before running it.
 
         Returns:
             Tuple of (allowed, reason_or_warning)
         """
-        # Check circuit breaker first
-        allowed, reason = self.check_circuit_breaker()
+        try:
+            return self._pre_operation_check(operation, project_id, skip_confirmation, include_history, rate_limit)
+        finally:
+            # The checks only mark state dirty; their changes are saved in one write
+            self._maybe_save()
+
+    async def pre_operation_check_async(self, operation: str, project_id: Optional[str] = None,
+                                        skip_confirmation: bool = False,
+                                        include_history: bool = False) -> tuple[bool, str]:
+        """
+        Async version of pre_operation_check(), for callers running an event loop.
+
+        Waits for the rate limit with asyncio.sleep (see AsyncTokenBucket) and
+        asks for confirmation in a worker thread, so the loop is never blocked.
+        """
+        try:
+            allowed, reason = self._check_gate()
+            if not allowed:
+                return False, reason
+
+            await AsyncTokenBucket(self).acquire(OPERATION_COSTS.get(operation, 1))
+
+            allowed, reason = self._check_limits(operation, project_id, include_history)
+            if not allowed or operation != "remix" or skip_confirmation:
+                return allowed, reason
+            return await asyncio.to_thread(self._confirm_remix, project_id)
+        finally:
+            self._maybe_save()
+
+    def _pre_operation_check(self, operation: str, project_id: Optional[str],
+                             skip_confirmation: bool, include_history: bool,
+                             rate_limit: bool = True) -> tuple[bool, str]:
+        """Run the checks behind pre_operation_check()."""
+        allowed, reason = self._check_gate()
         if not allowed:
             return False, reason
 
         # Wait for rate limit (instead of blocking, we wait)
         # This provides smoother UX while still enforcing the limit
-        self.wait_for_rate_limit()
+        if rate_limit:
+            self.wait_for_rate_limit(cost=OPERATION_COSTS.get(operation, 1))
+
+        allowed, reason = self._check_limits(operation, project_id, include_history)
+        if not allowed:
+            return False, reason
+
+        # Request confirmation for remix operations
+        if operation == "remix" and not skip_confirmation:
+            return self._confirm_remix(project_id)
+
+        return True, ""
 
+    def _check_gate(self) -> tuple[bool, str]:
+        """Checks that come before waiting for the rate limit."""
+        # Long-running processes may have been started on an earlier day
+        self._check_daily_reset()
+
+        # Check circuit breaker first
+        return self.check_circuit_breaker()
+
+    def _check_limits(self, operation: str, project_id: Optional[str],
+                      include_history: bool) -> tuple[bool, str]:
+        """Daily limit and idempotency checks (after the rate limit wait)."""
         # Check daily limits
         allowed, reason = self.check_daily_limits(operation)
         if not allowed:
@@ -245,10 +570,11 @@ class SafetyManager:
 
         # Check idempotency for remix operations
         if operation == "remix" and project_id:
-            is_new, existing_id = self.check_idempotency(operation, project_id)
+            is_new, existing_id = self.check_idempotency(operation, project_id, include_history)
             if not is_new:
-                console.print(Panel(
-                    f"[yellow]This project was already remixed in this session.[/yellow]\n\n"
+                from rich.panel import Panel
+                _console().print(Panel(
+                    f"[yellow]This project was already remixed today with the same options.[/yellow]\n\n"
                     f"Existing remix ID: {existing_id}\n\n"
                     "To create another remix, use --force flag.",
                     title="Idempotency Check",
@@ -257,23 +583,25 @@ class SafetyManager:
                 return False, f"Already remixed: {existing_id}"
 
         # Warn if approaching limits
-        if self.state.requests_today >= MAX_OPERATIONS_PER_SESSION:
-            console.print(f"[yellow]Warning: {self.state.requests_today} operations this session[/yellow]")
+        if self._verbose and self.state.requests_today >= MAX_OPERATIONS_PER_SESSION:
+            _console().print(f"[yellow]Warning: {self.state.requests_today} operations this session[/yellow]")
 
-        # Request confirmation for remix operations
-        if operation == "remix" and not skip_confirmation:
-            console.print(Panel(
-                f"[bold]Confirm Remix Operation[/bold]\n\n"
-                f"Project ID: {project_id}\n"
-                f"Remixes today: {self.state.remixes_today}/{MAX_REMIXES_PER_DAY}\n"
-                f"Requests today: {self.state.requests_today}",
-                title="Confirmation Required",
-                border_style="blue",
-            ))
-            response = console.input("[bold]Proceed with remix? (yes/no): [/bold]")
-            if response.lower() not in ("yes", "y"):
-                return False, "User declined"
+        return True, ""
 
+    def _confirm_remix(self, project_id: Optional[str]) -> tuple[bool, str]:
+        """Ask the user to confirm a remix."""
+        from rich.panel import Panel
+        _console().print(Panel(
+            f"[bold]Confirm Remix Operation[/bold]\n\n"
+            f"Project ID: {project_id}\n"
+            f"Remixes today: {self.state.remixes_today}/{MAX_REMIXES_PER_DAY}\n"
+            f"Requests today: {self.state.requests_today}",
+            title="Confirmation Required",
+            border_style="blue",
+        ))
+        response = _console().input("[bold]Proceed with remix? (yes/no): [/bold]")
+        if response.lower() not in ("yes", "y"):
+            return False, "User declined"
         return True, ""
 
     # =========================================================================
@@ -282,9 +610,33 @@ class SafetyManager:
 
     def record_request(self, operation: str, endpoint: str, success: bool,
                        error: Optional[str] = None, response_code: Optional[int] = None) -> None:
-        """Record a completed request."""
+        """
+        Record a completed request.
+
+        The state file is written in batches (see STATE_FLUSH_*); call
+        flush() to force a write. Pending records are also flushed at exit.
+        """
+        if self._add_request(operation, endpoint, success, error, response_code):
+            self._wait_for_writer()
+
+    async def record_request_async(self, operation: str, endpoint: str, success: bool,
+                                   error: Optional[str] = None, response_code: Optional[int] = None) -> None:
+        """Async version of record_request(): any wait for the state writer happens in a worker thread."""
+        if self._add_request(operation, endpoint, success, error, response_code):
+            await asyncio.to_thread(self._wait_for_writer)
+
+    def _add_request(self, operation: str, endpoint: str, success: bool,
+                     error: Optional[str], response_code: Optional[int]) -> bool:
+        """
+        Update the state for a completed request and queue a save if due.
+
+        Returns True if the caller must wait for the save (the circuit
+        breaker tripped on this request, which other processes must see
+        right away).
+        """
+        tripped = False
         self.state.requests_today += 1
-        self.state.last_request_time = datetime.now().isoformat()
+        self._last_request_at = time.time()
 
         if success:
             self.state.consecutive_failures = 0
@@ -293,9 +645,12 @@ class SafetyManager:
 
             # Trip circuit breaker if too many failures
             if self.state.consecutive_failures >= MAX_CONSECUTIVE_FAILURES:
-                reset_time = datetime.now() + timedelta(minutes=CIRCUIT_BREAKER_RESET_MINUTES)
-                self.state.circuit_breaker_until = reset_time.isoformat()
-                console.print(Panel(
+                until_ns = time.time_ns() + CIRCUIT_BREAKER_RESET_MINUTES * 60 * NS_PER_SECOND
+                tripped = self.state.circuit_breaker_until_ns is None
+                self.state.circuit_breaker_until_ns = until_ns
+                reset_time = datetime.fromtimestamp(until_ns / NS_PER_SECOND)
+                from rich.panel import Panel
+                _console().print(Panel(
                     f"[red bold]Circuit Breaker Tripped[/red bold]\n\n"
                     f"{MAX_CONSECUTIVE_FAILURES} consecutive failures detected.\n"
                     f"Operations paused until: {reset_time.strftime('%H:%M:%S')}\n\n"
@@ -305,59 +660,103 @@ class SafetyManager:
                 ))
 
         self._log_request(operation, endpoint, success, error, response_code)
-        self._save_state()
+        self._pending_records += 1
 
-    def record_remix_success(self, source_project_id: str, new_project_id: str) -> None:
+        if tripped:
+            # Other processes must see a tripped breaker immediately
+            self._save_state()
+            return True
+        self._maybe_flush()
+        return False
+
+    def record_remix_success(self, source_project_id: str, new_project_id: str,
+                             include_history: bool = False) -> None:
         """Record a successful remix for idempotency."""
-        self.state.remixes_today += 1
-        self.state.remix_history[source_project_id] = new_project_id
+        self._add_remix(source_project_id, new_project_id, include_history)
+        self._save_state(wait=True)  # Idempotency must hold across processes
+
+    async def record_remix_success_async(self, source_project_id: str, new_project_id: str,
+                                         include_history: bool = False) -> None:
+        """Async version of record_remix_success(): waits for the save without blocking the event loop."""
+        self._add_remix(source_project_id, new_project_id, include_history)
         self._save_state()
+        await asyncio.to_thread(self._wait_for_writer)
+
+    def _add_remix(self, source_project_id: str, new_project_id: str, include_history: bool) -> None:
+        """Count a remix and add it to the idempotency history."""
+        self.state.remixes_today += 1
+        # Insertion-ordered dict as a bounded history: re-insert as newest, evict oldest
+        history = self.state.remix_history
+        key = remix_key(source_project_id, include_history)
+        history.pop(key, None)
+        history[key] = new_project_id
+        while len(history) > MAX_REMIX_HISTORY:
+            del history[next(iter(history))]
 
     # =========================================================================
     # Utility Methods
     # =========================================================================
 
-    def wait_for_rate_limit(self) -> None:
-        """Wait until rate limit allows next request."""
-        if self.state.last_request_time:
-            last_time = datetime.fromisoformat(self.state.last_request_time)
-            elapsed = (datetime.now() - last_time).total_seconds()
-            if elapsed < MIN_REQUEST_INTERVAL_SECONDS:
-                wait_time = MIN_REQUEST_INTERVAL_SECONDS - elapsed
-                console.print(f"[dim]Rate limiting: waiting {wait_time:.1f}s...[/dim]")
-                time.sleep(wait_time)
+    def wait_for_rate_limit(self, cost: float = 1) -> None:
+        """
+        Take `cost` tokens from the rate limit bucket.
+
+        Returns immediately while tokens are available, so short bursts are
+        not serialized; only sleeps for the deficit once the bucket runs dry.
+        """
+        wait_time = self._reserve_tokens(cost)
+        if wait_time > 0:
+            if self._verbose:
+                _console().print(f"[dim]Rate limiting: waiting {wait_time:.1f}s...[/dim]")
+            time.sleep(wait_time)
 
     def get_retry_delay(self, attempt: int) -> float:
         """Calculate exponential backoff delay for retries."""
-        delay = min(RETRY_BACKOFF_BASE ** attempt, RETRY_BACKOFF_MAX)
-        return delay
+        if attempt < len(_RETRY_DELAYS):
+            return _RETRY_DELAYS[attempt]
+        return min(RETRY_BACKOFF_BASE ** attempt, RETRY_BACKOFF_MAX)
 
     def should_retry(self, attempt: int, error: Optional[str] = None) -> bool:
         """Determine if operation should be retried."""
-        if attempt >= MAX_RETRIES:
-            return False
-
         # Don't retry on certain errors
-        if error:
-            no_retry_errors = ["403", "401", "404", "already remixed", "supabase"]
-            if any(e in error.lower() for e in no_retry_errors):
-                return False
-
-        return True
+        return attempt < MAX_RETRIES and not (error and _NO_RETRY_RE.search(error))
 
     def print_status(self) -> None:
         """Print current safety status."""
-        console.print(Panel(
+        from rich.panel import Panel
+        _console().print(Panel(
             f"[bold]Safety Status[/bold]\n\n"
             f"Requests today: {self.state.requests_today}/{MAX_REQUESTS_PER_HOUR}\n"
             f"Remixes today: {self.state.remixes_today}/{MAX_REMIXES_PER_DAY}\n"
             f"Consecutive failures: {self.state.consecutive_failures}/{MAX_CONSECUTIVE_FAILURES}\n"
-            f"Circuit breaker: {'ACTIVE' if self.state.circuit_breaker_until else 'OK'}",
+            f"Circuit breaker: {'ACTIVE' if self.state.circuit_breaker_until_ns else 'OK'}",
             title="Safety Dashboard",
             border_style="green" if self.state.consecutive_failures == 0 else "yellow",
         ))
 
 
+# =============================================================================
+# Async Rate Limiting
+# =============================================================================
+
+class AsyncTokenBucket:
+    """
+    Awaitable access to a SafetyManager's rate limit bucket.
+
+    Shares the token balance with the sync wait_for_rate_limit(), but waits
+    with asyncio.sleep so concurrent tasks in the event loop are not blocked.
+    """
+
+    def __init__(self, safety: SafetyManager):
+        self.safety = safety
+
+    async def acquire(self, cost: float = 1) -> None:
+        """Take `cost` tokens, sleeping asynchronously for any deficit."""
+        wait_time = self.safety._reserve_tokens(cost)
+        if wait_time > 0:
+            await asyncio.sleep(wait_time)
+
+
 # =============================================================================
 # Decorator for Safe Operations
 # =============================================================================
@@ -374,25 +773,26 @@ def safe_operation(operation_name: str):
     def decorator(func: Callable):
         @wraps(func)
         def wrapper(*args, **kwargs):
-            safety = SafetyManager()
+            safety = get_safety_manager()
 
             # Extract project_id from args/kwargs if present
             project_id = kwargs.get("project_id") or (args[0] if args else None)
             skip_confirm = kwargs.get("skip_confirmation", False)
+            include_history = kwargs.get("include_history", False)
 
             # Pre-operation check
             allowed, reason = safety.pre_operation_check(
                 operation_name,
                 project_id=project_id,
                 skip_confirmation=skip_confirm,
+                include_history=include_history,
             )
 
             if not allowed:
-                console.print(f"[red]Operation blocked: {reason}[/red]")
+                _console().print(f"[red]Operation blocked: {reason}[/red]")
                 return None
 
-            # Wait for rate limit
-            safety.wait_for_rate_limit()
+            # pre_operation_check has already waited for (and taken) rate limit tokens
 
             # Execute operation with retry logic
             last_error = None
@@ -415,6 +815,7 @@ def safe_operation(operation_name: str):
                         safety.record_remix_success(
                             project_id,
                             getattr(result, "project_id", "unknown"),
+                            include_history=include_history,
                         )
 
                     return result
@@ -425,12 +826,12 @@ def safe_operation(operation_name: str):
 
                     if safety.should_retry(attempt, last_error):
                         delay = safety.get_retry_delay(attempt)
-                        console.print(f"[yellow]Retry {attempt + 1}/{MAX_RETRIES} after {delay:.1f}s...[/yellow]")
+                        _console().print(f"[yellow]Retry {attempt + 1}/{MAX_RETRIES} after {delay:.1f}s...[/yellow]")
                         time.sleep(delay)
                     else:
                         break
 
-            console.print(f"[red]Operation failed after {MAX_RETRIES + 1} attempts: {last_error}[/red]")
+            _console().print(f"[red]Operation failed after {MAX_RETRIES + 1} attempts: {last_error}[/red]")
             return None
 
         return wrapper
@@ -11,16 +11,25 @@ Flow:
 4. Handle confirmation dialog (configure history, click Remix)
 5. Wait for redirect to new project URL
 """
+import asyncio
+import atexit
+import hashlib
+import json
+import os
 import re
+import tempfile
+import threading
 import time
-from typing import Optional
+from pathlib import Path
+from typing import Optional, Dict, Any, List
 from dataclasses import dataclass
-from playwright.sync_api import sync_playwright, TimeoutError as PlaywrightTimeout
+from playwright.sync_api import sync_playwright, expect, Playwright, Browser, BrowserContext, Page, TimeoutError as PlaywrightTimeout
+from playwright.async_api import async_playwright, expect as async_expect, Browser as AsyncBrowser
 from rich.console import Console
 from rich.panel import Panel
 
-from config import LovableConfig, get_config
-from safety import get_safety_manager, SafetyManager
+from config import LovableConfig, get_config, extract_project_id  # noqa: F401 (re-exported)
+from safety import get_safety_manager, SafetyManager, AsyncTokenBucket, MAX_REMIXES_PER_DAY, OPERATION_COSTS
 
 console = Console()
 
@@ -28,6 +37,77 @@ console = Console()
 NAVIGATION_TIMEOUT = 30000  # 30 seconds
 ACTION_TIMEOUT = 10000  # 10 seconds
 REMIX_CREATION_TIMEOUT = 120000  # 2 minutes
+DIALOG_TIMEOUT = 3000  # 3 seconds for the confirmation dialog to show up
+NEW_PROJECT_POLL_INTERVAL = 250  # Sync flow: how often captured remix API responses are checked (ms)
+
+# In-page check for Step 5: the project ID in location.href once it differs
+# from the source project (falsy until then, which keeps wait_for_function polling)
+NEW_PROJECT_ID_JS = """(sourceId) => {
+    const match = location.href.match(/\\/projects\\/([a-f0-9-]+)/);
+    return match && match[1] !== sourceId ? match[1] : null;
+}"""
+
+# Chromium flags for the automated remix flow
+LAUNCH_ARGS = ["--disable-blink-features=AutomationControlled", "--disable-features=TranslateUI"]
+
+# Init script that turns off CSS animations and transitions, so menus and dialogs
+# are actionable as soon as they are inserted instead of after their fade-in
+DISABLE_ANIMATIONS_JS = """
+document.addEventListener("DOMContentLoaded", () => {
+    const style = document.createElement("style");
+    style.textContent = "*, *::before, *::after {"
+        + " animation-duration: 0s !important; animation-delay: 0s !important;"
+        + " transition-duration: 0s !important; transition-delay: 0s !important; }";
+    document.head.appendChild(style);
+});
+"""
+
+# Sets the dialog's "Include project history" switch in one round-trip.
+# Returns "toggled", "unchanged", or null when the dialog has no such switch.
+SET_HISTORY_SWITCH_JS = """(want) => {
+    const byId = (id) => document.getElementById(id)?.innerText || "";
+    const label = (sw) => sw.getAttribute("aria-label")
+        || (sw.getAttribute("aria-labelledby") || "").split(/\\s+/).map(byId).join(" ").trim()
+        || (sw.id && document.querySelector(`label[for="${CSS.escape(sw.id)}"]`)?.innerText)
+        || sw.closest("label")?.innerText
+        || "";
+    const sw = [...document.querySelectorAll("[role='dialog'] [role='switch']")]
+        .find((el) => label(el).includes("Include project history"));
+    if (!sw) return null;
+    if ((sw.getAttribute("aria-checked") === "true") === want) return "unchanged";
+    sw.click();
+    return "toggled";
+}"""
+
+# Requests the remix flow never needs, aborted when config.block_resources is set
+BLOCKED_RESOURCE_TYPES = frozenset({"image", "font", "media"})
+_TRACKER_HOST_RE = re.compile(r"^https?://[^/]*(segment|datadog|sentry|hotjar|google-analytics)")
+
+# Text of the "Remix this project" menu item
+_REMIX_ITEM_RE = re.compile(r"remix", re.I)
+
+# Remixes a pooled page runs before it is replaced (bounds renderer JS heap growth)
+PAGE_RECYCLE_EVERY = 50
+
+# Remixes run at once by ui_remix_batch (one browser context each)
+BATCH_CONCURRENCY = 4
+
+# Process-wide Playwright and browsers, reused across ui_remix calls so only the
+# first remix pays for launching Chromium. Keyed by (headless, slow_mo).
+_playwright: Optional[Playwright] = None
+_browsers: Dict[tuple, Browser] = {}
+_browser_lock = threading.Lock()
+
+# Remix contexts kept open between ui_remix calls, each with one reusable page.
+# Keyed by (browser, session file, block_resources).
+_contexts: Dict[tuple, "_PooledContext"] = {}
+
+# Parsed session files: path -> (mtime_ns, storage_state). Reparsed only when the file changes.
+_storage_states: Dict[Path, tuple] = {}
+
+# Digest of the storage state last read from / written to each session file,
+# so a state that has not changed is not written back
+_state_digests: Dict[Path, bytes] = {}
 
 
 @dataclass
@@ -39,10 +119,288 @@ class UIRemixResult:
     error: Optional[str] = None
 
 
-def extract_project_id(url: str) -> Optional[str]:
-    """Extract project ID from a Lovable URL."""
-    match = re.search(r'/projects/([a-f0-9-]+)', url)
-    return match.group(1) if match else None
+@dataclass
+class _PooledContext:
+    """A browser context kept open across remixes, with the page they reuse."""
+    context: BrowserContext
+    page: Page
+    session_mtime_ns: int  # Session file version the context was created from
+    page_uses: int = 0
+    remixes: int = 0  # Successful remixes since the context was created
+
+
+def _get_browser(config: LovableConfig, debug: bool = False) -> Browser:
+    """
+    Get the shared browser for the config's launch options, launching it on first use.
+
+    slow_mo only applies to debug runs - elsewhere it is pure delay.
+    """
+    global _playwright
+    slow_mo = config.slow_mo if debug else 0
+    key = (config.headless, slow_mo)
+    with _browser_lock:
+        browser = _browsers.get(key)
+        if browser is None or not browser.is_connected():
+            if _playwright is None:
+                _playwright = sync_playwright().start()
+                atexit.register(_close_browsers)
+            console.print("[blue]Launching browser...[/blue]")
+            browser = _playwright.chromium.launch(
+                headless=config.headless,
+                slow_mo=slow_mo,
+                args=LAUNCH_ARGS,
+            )
+            _browsers[key] = browser
+        return browser
+
+
+def _close_browsers() -> None:
+    """Close the shared browsers and stop Playwright (registered to run at exit)."""
+    global _playwright
+    with _browser_lock:
+        for browser in _browsers.values():
+            try:
+                browser.close()
+            except Exception:
+                pass  # Already gone
+        _browsers.clear()
+        _contexts.clear()
+        if _playwright is not None:
+            _playwright.stop()
+            _playwright = None
+
+
+def _load_storage_state(session_file: Path) -> Dict[str, Any]:
+    """Load the saved browser session, reusing the parsed copy while the file is unchanged."""
+    mtime_ns = session_file.stat().st_mtime_ns
+    cached = _storage_states.get(session_file)
+    if cached is None or cached[0] != mtime_ns:
+        cached = (mtime_ns, json.loads(session_file.read_text()))
+        _storage_states[session_file] = cached
+        _state_digests[session_file] = _state_digest(cached[1])
+    return cached[1]
+
+
+def _state_digest(state: Dict[str, Any]) -> bytes:
+    """Digest of a storage state, independent of key order."""
+    return hashlib.blake2b(json.dumps(state, sort_keys=True).encode(), digest_size=16).digest()
+
+
+def _maybe_save_state(state: Dict[str, Any], session_file: Path, loaded_mtime_ns: int) -> bool:
+    """
+    Write a context's storage state back to the session file if it changed.
+
+    Keeps refreshed cookies without rewriting an identical file after every
+    run. `loaded_mtime_ns` is the file version the context was created from;
+    if the file has changed since (e.g. a new login), it is left alone.
+    Returns True if the file was written.
+    """
+    if session_file.stat().st_mtime_ns != loaded_mtime_ns:
+        return False
+    digest = _state_digest(state)
+    if _state_digests.get(session_file) == digest:
+        return False
+    # Own temp file - the daemon, CLI runs and batches may write back at the same time
+    with tempfile.NamedTemporaryFile(
+        "w", dir=session_file.parent, prefix=f"{session_file.name}.", suffix=".tmp", delete=False,
+    ) as tmp:
+        tmp.write(json.dumps(state))
+    try:
+        os.replace(tmp.name, session_file)
+    except BaseException:
+        os.unlink(tmp.name)
+        raise
+    _storage_states[session_file] = (session_file.stat().st_mtime_ns, state)
+    _state_digests[session_file] = digest
+    return True
+
+
+def _get_pooled_context(
+    browser: Browser,
+    session_file: Path,
+    block_resources: bool,
+    recycle_every: int = 0,
+) -> _PooledContext:
+    """
+    Get the pooled remix context for this browser and session, creating it on first use.
+
+    The context is rebuilt when the session file changes, after `recycle_every`
+    successful remixes (0 = never) to keep memory from growing in long runs,
+    and when it closes or its page crashes. The page is replaced every
+    PAGE_RECYCLE_EVERY remixes.
+    """
+    key = (browser, session_file, block_resources)
+    mtime_ns = session_file.stat().st_mtime_ns
+    pooled = _contexts.get(key)
+    if pooled is not None and recycle_every and pooled.remixes >= recycle_every:
+        # End of this context's run - keep any cookies it refreshed
+        try:
+            if _maybe_save_state(pooled.context.storage_state(), session_file, pooled.session_mtime_ns):
+                mtime_ns = session_file.stat().st_mtime_ns
+        except Exception:
+            pass  # Best effort - the saved session is still valid
+        _discard_context(key)
+        pooled = None
+    if pooled is not None and (pooled.session_mtime_ns != mtime_ns or pooled.page.is_closed()):
+        _discard_context(key)
+        pooled = None
+
+    if pooled is None:
+        context = browser.new_context(
+            storage_state=_load_storage_state(session_file),
+            reduced_motion="reduce",
+        )
+        context.add_init_script(DISABLE_ANIMATIONS_JS)
+        if block_resources:
+            context.route("**/*", _route_request)
+        pooled = _contexts[key] = _PooledContext(context, _new_page(context), mtime_ns)
+        context.on("close", lambda _: _forget_context(key, pooled))
+        pooled.page.on("crash", lambda _: _on_page_crash(key, pooled))
+    elif pooled.page_uses >= PAGE_RECYCLE_EVERY:
+        pooled.page.close()
+        pooled.page = _new_page(pooled.context)
+        pooled.page.on("crash", lambda _: _on_page_crash(key, pooled))
+        pooled.page_uses = 0
+
+    pooled.page_uses += 1
+    return pooled
+
+
+def _new_page(context: BrowserContext) -> Page:
+    """Open a page with the remix flow's default action timeout."""
+    page = context.new_page()
+    page.set_default_timeout(ACTION_TIMEOUT)
+    return page
+
+
+def _forget_context(key: tuple, pooled: _PooledContext) -> None:
+    """Stop reusing a pooled context that closed (unless it was already replaced)."""
+    if _contexts.get(key) is pooled:
+        del _contexts[key]
+
+
+def _on_page_crash(key: tuple, pooled: _PooledContext) -> None:
+    """Close and drop a pooled context whose page crashed (unless it was already replaced)."""
+    if _contexts.get(key) is pooled:
+        _discard_context(key)
+
+
+def _discard_context(key: tuple) -> None:
+    """Drop a pooled context (closing it), e.g. after a failed remix left its page in an unknown state."""
+    pooled = _contexts.pop(key, None)
+    if pooled is not None:
+        try:
+            pooled.context.close()
+        except Exception:
+            pass  # Browser already gone
+
+
+def _is_remix_response(response) -> bool:
+    """Match the successful POST .../projects/{id}/remix API response."""
+    path = response.url.split("?", 1)[0].rstrip("/")
+    return response.request.method == "POST" and "/projects/" in path and path.endswith("/remix") and response.ok
+
+
+def _remix_response_project_id(data: Any) -> Optional[str]:
+    """Pull the new project ID out of a remix API response body (key names vary)."""
+    if not isinstance(data, dict):
+        return None
+    for key in ("id", "project_id", "projectId"):
+        if data.get(key):
+            return str(data[key])
+    return None
+
+
+def _wait_for_new_project(page: Page, project_id: str, remix_responses: List[Any]) -> Optional[str]:
+    """
+    Wait for the new project ID from whichever comes first: a captured remix
+    API response (which usually arrives before the page navigates) or the
+    project URL changing. Returns None after REMIX_CREATION_TIMEOUT.
+
+    The sync API can only wait on one thing at a time, so the in-page URL
+    check runs in short slices; the response listener keeps filling
+    `remix_responses` while they run.
+    """
+    deadline = time.monotonic() + REMIX_CREATION_TIMEOUT / 1000
+    while True:
+        while remix_responses:
+            new_project_id = _read_remix_response(remix_responses.pop(0))
+            if new_project_id:
+                return new_project_id
+
+        remaining_ms = (deadline - time.monotonic()) * 1000
+        if remaining_ms <= 0:
+            return None
+        # Poll location.href in the page, which also sees client-side URL
+        # changes that never fire a navigation event
+        try:
+            handle = page.wait_for_function(
+                NEW_PROJECT_ID_JS, arg=project_id, timeout=min(remaining_ms, NEW_PROJECT_POLL_INTERVAL),
+            )
+            return handle.json_value()
+        except PlaywrightTimeout:
+            pass
+
+
+async def _wait_for_new_project_async(page, project_id: str, remix_responses: asyncio.Queue) -> Optional[str]:
+    """Async version of _wait_for_new_project: races the URL check against the response queue."""
+    url_task = asyncio.ensure_future(
+        page.wait_for_function(NEW_PROJECT_ID_JS, arg=project_id, timeout=REMIX_CREATION_TIMEOUT)
+    )
+    response_task = None
+    try:
+        while True:
+            response_task = asyncio.ensure_future(remix_responses.get())
+            done, _ = await asyncio.wait({url_task, response_task}, return_when=asyncio.FIRST_COMPLETED)
+            if response_task in done:
+                try:
+                    new_project_id = _remix_response_project_id(await response_task.result().json())
+                except Exception:
+                    new_project_id = None  # No JSON body - keep waiting
+                if new_project_id:
+                    return new_project_id
+                continue
+            try:
+                return await url_task.result().json_value()
+            except PlaywrightTimeout:
+                return None
+    finally:
+        for task in (url_task, response_task):
+            if task is not None and not task.done():
+                task.cancel()
+
+
+def _read_remix_response(response) -> Optional[str]:
+    """New project ID from a remix API response body, or None if it has none (or is not JSON)."""
+    try:
+        return _remix_response_project_id(response.json())
+    except Exception:
+        return None
+
+
+def _quiet(*args, **kwargs) -> None:
+    """Stand-in for console.print when progress output is off."""
+
+
+def _is_blocked(request) -> bool:
+    """Whether a request is one the remix flow can do without."""
+    return request.resource_type in BLOCKED_RESOURCE_TYPES or bool(_TRACKER_HOST_RE.search(request.url))
+
+
+def _route_request(route) -> None:
+    """Context route handler: abort blocked requests, let the rest through."""
+    if _is_blocked(route.request):
+        route.abort()
+    else:
+        route.continue_()
+
+
+async def _route_request_async(route) -> None:
+    """Async version of _route_request."""
+    if _is_blocked(route.request):
+        await route.abort()
+    else:
+        await route.continue_()
 
 
 def ui_remix(
@@ -52,6 +410,7 @@ def ui_remix(
     config: Optional[LovableConfig] = None,
     safety: Optional[SafetyManager] = None,
     debug: bool = False,
+    browser: Optional[Browser] = None,
 ) -> Optional[UIRemixResult]:
     """
     Create a remix of a Lovable project via browser UI automation.
@@ -62,7 +421,9 @@ def ui_remix(
         skip_confirmation: Skip the safety confirmation prompt
         config: Optional config override
         safety: Optional safety manager override
-        debug: Enable debug output
+        debug: Print step-by-step progress, load the full page and honour slow_mo
+        browser: Already running browser to use (e.g. the daemon's);
+            by default the shared process-wide browser is used
 
     Returns:
         UIRemixResult with new project details, or None if blocked
@@ -75,6 +436,7 @@ def ui_remix(
         operation="remix",
         project_id=project_id,
         skip_confirmation=skip_confirmation,
+        include_history=include_history,
     )
 
     if not allowed:
@@ -95,152 +457,422 @@ def ui_remix(
         console.print("[red]No session found. Run 'python cli.py auth' first.[/red]")
         return UIRemixResult(success=False, error="No session. Authenticate first.")
 
-    with sync_playwright() as p:
-        console.print("[blue]Launching browser...[/blue]")
+    browser = browser or _get_browser(config, debug)
+    # Debug runs load the page in full
+    block_resources = config.block_resources and not debug
+    return _remix_in_browser(
+        browser, project_id, include_history, session_file, safety, block_resources,
+        verbose=debug or config.verbose,
+        recycle_every=config.context_recycle_every,
+    )
 
-        browser = p.chromium.launch(
-            headless=config.headless,
-            slow_mo=config.slow_mo,
-        )
 
-        try:
-            # Load saved session
-            context = browser.new_context(storage_state=str(session_file))
-            console.print("[green]✓ Loaded saved session[/green]")
-
-            page = context.new_page()
-            page.set_default_timeout(ACTION_TIMEOUT)
+def _remix_in_browser(
+    browser: Browser,
+    project_id: str,
+    include_history: bool,
+    session_file: Path,
+    safety: SafetyManager,
+    block_resources: bool = False,
+    verbose: bool = False,
+    recycle_every: int = 0,
+) -> UIRemixResult:
+    """
+    Run the remix flow on the pooled page of an already running browser.
 
-            # Step 1: Navigate to project
-            console.print(f"[blue]Step 1: Navigating to project...[/blue]")
+    A failed remix discards the pooled context so the next one starts clean.
+    Step-by-step progress is only printed when verbose; the outcome always is.
+    """
+    log = console.print if verbose else _quiet
+    pool_key = (browser, session_file, block_resources)
+    pooled = None
+    page = None
+    succeeded = False
+
+    # Remix API responses, captured while the page works towards the new project
+    remix_responses: List[Any] = []
+
+    def on_response(response) -> None:
+        if _is_remix_response(response):
+            remix_responses.append(response)
+
+    try:
+        pooled = _get_pooled_context(browser, session_file, block_resources, recycle_every)
+        page = pooled.page
+        log("[green]✓ Loaded saved session[/green]")
+
+        # Step 1: Navigate to project
+        log(f"[blue]Step 1: Navigating to project...[/blue]")
+        # Only wait for the navigation to commit - the page keeps loading while
+        # we wait for the menu button below (Lovable is an SPA with websockets,
+        # so load states say little about readiness anyway)
+        try:
             page.goto(
                 f"https://lovable.dev/projects/{project_id}",
                 timeout=NAVIGATION_TIMEOUT,
-                wait_until="domcontentloaded"
+                wait_until="commit",
             )
-            # Don't use networkidle - Lovable has continuous websocket connections
-            page.wait_for_timeout(3000)
-            console.print("[green]✓ Project page loaded[/green]")
-
-            # Step 2: Open project menu
-            console.print(f"[blue]Step 2: Opening project menu...[/blue]")
-            menu_button = page.locator("button[aria-haspopup='menu']").first
-            menu_button.click(timeout=ACTION_TIMEOUT)
-            page.wait_for_timeout(500)
-            console.print("[green]✓ Menu opened[/green]")
-
-            # Step 3: Click "Remix this project"
-            console.print(f"[blue]Step 3: Clicking 'Remix this project'...[/blue]")
-
-            # Find the remix menu item
-            menu_items = page.locator("[role='menuitem']").all()
-            remix_item = None
-            for item in menu_items:
-                try:
-                    text = item.inner_text(timeout=500).strip().lower()
-                    if "remix" in text:
-                        remix_item = item
-                        break
-                except:
-                    pass
+        except PlaywrightTimeout:
+            pass  # The menu button wait below surfaces a real failure
+        # The project menu button is what Step 2 needs, so wait for exactly that
+        menu_button = page.locator("button[aria-haspopup='menu']").first
+        menu_button.wait_for(state="visible", timeout=NAVIGATION_TIMEOUT)
+        log("[green]✓ Project page loaded[/green]")
+
+        # Step 2: Open project menu
+        log(f"[blue]Step 2: Opening project menu...[/blue]")
+        menu_button.click(timeout=ACTION_TIMEOUT)
+        page.locator("[role='menuitem']").first.wait_for(state="visible")
+        log("[green]✓ Menu opened[/green]")
+
+        # Step 3: Click "Remix this project"
+        log(f"[blue]Step 3: Clicking 'Remix this project'...[/blue]")
+
+        # Find the remix menu item (text matched in the browser, one round-trip)
+        remix_item = page.locator("[role='menuitem']").filter(has_text=_REMIX_ITEM_RE).first
+        remix_item.wait_for(state="visible", timeout=ACTION_TIMEOUT)  # Raises if there is none
+        # From here on the remix API response may arrive at any moment
+        page.on("response", on_response)
+        remix_item.click()
+        log("[green]✓ Remix menu item clicked[/green]")
+
+        # Step 4: Handle confirmation dialog
+        log(f"[blue]Step 4: Handling confirmation dialog...[/blue]")
+
+        dialog = page.locator("[role='dialog']")
+        try:
+            expect(dialog).to_be_visible(timeout=DIALOG_TIMEOUT)
+            dialog_shown = True
+        except AssertionError:
+            dialog_shown = False
+        if dialog_shown:
+            log("[green]✓ Dialog appeared[/green]")
+
+            # Configure history toggle if needed (it is not always present)
+            toggle = page.evaluate(SET_HISTORY_SWITCH_JS, include_history)
+            if toggle == "toggled":
+                log(f"[green]✓ Toggled history to: {include_history}[/green]")
+            elif toggle == "unchanged":
+                log(f"[green]✓ History already set to: {include_history}[/green]")
+            else:
+                console.print(
+                    f"[yellow]Warning: 'Include project history' switch not found - "
+                    f"include_history={include_history} could not be applied[/yellow]"
+                )
 
-            if remix_item is None:
-                raise PlaywrightTimeout("Could not find 'Remix this project' menu item")
+            # Click confirm button (click() waits for it to be actionable)
+            page.locator("[role='dialog'] button:has-text('Remix')").first.click()
+            log("[green]✓ Confirmed remix[/green]")
+        else:
+            log("[yellow]No dialog - remix may start directly[/yellow]")
+
+        # Step 5: Wait for redirect to new project
+        log(f"[blue]Step 5: Waiting for new project...[/blue]")
+
+        new_project_id = _wait_for_new_project(page, project_id, remix_responses)
+        if new_project_id:
+            log(f"[green]✓ New project detected: {new_project_id}[/green]")
+
+        if new_project_id:
+            new_project_url = f"https://lovable.dev/projects/{new_project_id}"
+
+            # Record success
+            safety.record_remix_success(project_id, new_project_id, include_history)
+            safety.record_request("ui_remix", "/ui/remix", True)
+            pooled.remixes += 1
+            succeeded = True
+
+            console.print(Panel(
+                f"[green bold]✓ Remix Created Successfully![/green bold]\n\n"
+                f"[bold]New Project ID:[/bold] {new_project_id}\n"
+                f"[bold]URL:[/bold] {new_project_url}",
+                title="Success",
+                border_style="green",
+            ))
+
+            return UIRemixResult(
+                success=True,
+                new_project_id=new_project_id,
+                new_project_url=new_project_url,
+            )
+        else:
+            error = "Timeout waiting for remix to complete"
+            console.print(f"[red]✗ {error}[/red]")
+            safety.record_request("ui_remix", "/ui/remix", False, error=error)
+            return UIRemixResult(success=False, error=error)
+
+    except PlaywrightTimeout as e:
+        error_msg = f"Timeout: {str(e)}"
+        console.print(f"[red]✗ {error_msg}[/red]")
+        safety.record_request("ui_remix", "/ui/remix", False, error=error_msg)
+        return UIRemixResult(success=False, error=error_msg)
+
+    except Exception as e:
+        error_msg = f"Error: {str(e)}"
+        console.print(f"[red]✗ {error_msg}[/red]")
+        safety.record_request("ui_remix", "/ui/remix", False, error=error_msg)
+        return UIRemixResult(success=False, error=error_msg)
+
+    finally:
+        if not succeeded and pooled is not None:
+            _discard_context(pool_key)
+        elif page is not None:
+            page.remove_listener("response", on_response)  # The page is reused
+
+
+def ui_remix_batch(
+    project_ids: List[str],
+    concurrency: int = BATCH_CONCURRENCY,
+    include_history: bool = True,
+    skip_confirmation: bool = False,
+    config: Optional[LovableConfig] = None,
+    safety: Optional[SafetyManager] = None,
+) -> List[Optional[UIRemixResult]]:
+    """
+    Remix several projects concurrently in one browser.
 
-            remix_item.click()
-            page.wait_for_timeout(500)
-            console.print("[green]✓ Remix menu item clicked[/green]")
+    Every project goes through the safety check first (one at a time, as it
+    may prompt); the allowed ones then run up to `concurrency` at a time,
+    each in its own browser context. Rate limit tokens are taken per project
+    right before its remix starts, so the limiter spaces out the remixes
+    themselves rather than the up-front checks. Since none of them has been recorded
+    yet while the checks run, the batch reserves a daily remix slot for every
+    approved project itself, and a repeated project ID is remixed only once.
 
-            # Step 4: Handle confirmation dialog
-            console.print(f"[blue]Step 4: Handling confirmation dialog...[/blue]")
+    Returns:
+        One entry per project ID, in order: a UIRemixResult, or None if blocked
+        (a repeated ID gets the same result as its first occurrence)
+    """
+    config = config or get_config()
+    safety = safety or get_safety_manager()
 
-            dialog = page.locator("[role='dialog']")
-            if dialog.is_visible(timeout=3000):
-                console.print("[green]✓ Dialog appeared[/green]")
+    allowed_ids = []
+    for project_id in dict.fromkeys(project_ids):
+        if safety.state.remixes_today + len(allowed_ids) >= MAX_REMIXES_PER_DAY:
+            reason = f"Daily remix limit reached ({MAX_REMIXES_PER_DAY}, counting this batch)"
+            console.print(f"[red]Blocked {project_id}: {reason}[/red]")
+            continue
+        allowed, reason = safety.pre_operation_check(
+            operation="remix",
+            project_id=project_id,
+            skip_confirmation=skip_confirmation,
+            include_history=include_history,
+            rate_limit=False,  # Taken per remix in _remix_batch_async
+        )
+        if allowed:
+            allowed_ids.append(project_id)
+        else:
+            console.print(f"[red]Blocked {project_id}: {reason}[/red]")
+
+    results: Dict[str, UIRemixResult] = {}
+    if allowed_ids:
+        session_file = config.get_session_file()
+        if not session_file.exists():
+            console.print("[red]No session found. Run 'python cli.py auth' first.[/red]")
+            error = UIRemixResult(success=False, error="No session. Authenticate first.")
+            results = {project_id: error for project_id in allowed_ids}
+        else:
+            results = asyncio.run(_remix_batch_async(
+                allowed_ids, concurrency, include_history, session_file, config, safety,
+            ))
+
+    return [results.get(project_id) for project_id in project_ids]
+
+
+async def _remix_batch_async(
+    project_ids: List[str],
+    concurrency: int,
+    include_history: bool,
+    session_file: Path,
+    config: LovableConfig,
+    safety: SafetyManager,
+) -> Dict[str, UIRemixResult]:
+    """
+    Run the remix flows for the given (already approved) projects in one async browser.
 
-                # Configure history toggle if needed
-                try:
-                    history_switch = page.get_by_role("switch", name="Include project history")
-                    if history_switch.is_visible(timeout=1000):
-                        current_state = history_switch.get_attribute("aria-checked") == "true"
-                        if current_state != include_history:
-                            history_switch.click()
-                            console.print(f"[green]✓ Toggled history to: {include_history}[/green]")
-                        else:
-                            console.print(f"[green]✓ History already set to: {include_history}[/green]")
-                except:
-                    pass  # History toggle may not always be present
-
-                # Click confirm button
-                confirm_btn = page.locator("[role='dialog'] button:has-text('Remix')").first
-                if confirm_btn.is_visible(timeout=2000):
-                    confirm_btn.click()
-                    console.print("[green]✓ Confirmed remix[/green]")
-            else:
-                console.print("[yellow]No dialog - remix may start directly[/yellow]")
+    The session state of the last successful remix is saved back once, at the end.
+    """
+    storage_state = _load_storage_state(session_file)
+    loaded_mtime_ns = _storage_states[session_file][0]
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+    bucket = AsyncTokenBucket(safety)
+    saved_states: List[Dict[str, Any]] = []
+
+    async with async_playwright() as p:
+        console.print(f"[blue]Launching browser for {len(project_ids)} remixes...[/blue]")
+        browser = await p.chromium.launch(headless=config.headless, args=LAUNCH_ARGS)
+
+        async def _one(project_id: str) -> UIRemixResult:
+            async with semaphore:
+                await bucket.acquire(OPERATION_COSTS.get("remix", 1))
+                return await _remix_in_browser_async(
+                    browser, project_id, include_history, storage_state, safety,
+                    config.block_resources, saved_states,
+                )
 
-            # Step 5: Wait for redirect to new project
-            console.print(f"[blue]Step 5: Waiting for new project...[/blue]")
+        try:
+            results = await asyncio.gather(*(_one(project_id) for project_id in project_ids))
+        finally:
+            await browser.close()
 
-            new_project_id = None
+    if saved_states:
+        _maybe_save_state(saved_states[-1], session_file, loaded_mtime_ns)
+    return dict(zip(project_ids, results))
 
-            # Use wait_for_url - this is what worked before
-            try:
-                page.wait_for_url(
-                    re.compile(rf"lovable\.dev/projects/(?!{project_id})([a-f0-9-]+)"),
-                    timeout=REMIX_CREATION_TIMEOUT
-                )
-                new_project_id = extract_project_id(page.url)
-                console.print(f"[green]✓ New project detected: {new_project_id}[/green]")
-            except PlaywrightTimeout:
-                # Check current URL as fallback
-                current_url = page.url
-                current_id = extract_project_id(current_url)
-                if current_id and current_id != project_id:
-                    new_project_id = current_id
-                    console.print(f"[green]✓ Found new project: {new_project_id}[/green]")
 
-            if new_project_id:
-                new_project_url = f"https://lovable.dev/projects/{new_project_id}"
-
-                # Record success
-                safety.record_remix_success(project_id, new_project_id)
-                safety.record_request("ui_remix", "/ui/remix", True)
-
-                console.print(Panel(
-                    f"[green bold]✓ Remix Created Successfully![/green bold]\n\n"
-                    f"[bold]New Project ID:[/bold] {new_project_id}\n"
-                    f"[bold]URL:[/bold] {new_project_url}",
-                    title="Success",
-                    border_style="green",
-                ))
-
-                return UIRemixResult(
-                    success=True,
-                    new_project_id=new_project_id,
-                    new_project_url=new_project_url,
-                )
-            else:
-                error = "Timeout waiting for remix to complete"
-                safety.record_request("ui_remix", "/ui/remix", False, error=error)
-                return UIRemixResult(success=False, error=error)
-
-        except PlaywrightTimeout as e:
-            error_msg = f"Timeout: {str(e)}"
-            console.print(f"[red]✗ {error_msg}[/red]")
-            safety.record_request("ui_remix", "/ui/remix", False, error=error_msg)
-            return UIRemixResult(success=False, error=error_msg)
-
-        except Exception as e:
-            error_msg = f"Error: {str(e)}"
-            console.print(f"[red]✗ {error_msg}[/red]")
-            safety.record_request("ui_remix", "/ui/remix", False, error=error_msg)
-            return UIRemixResult(success=False, error=error_msg)
+async def ui_remix_async(
+    project_id: str,
+    include_history: bool = True,
+    skip_confirmation: bool = False,
+    config: Optional[LovableConfig] = None,
+    safety: Optional[SafetyManager] = None,
+    debug: bool = False,
+    browser: Optional[AsyncBrowser] = None,
+) -> Optional[UIRemixResult]:
+    """
+    Async version of ui_remix, for callers that already run an event loop.
+
+    Browser work and the safety bookkeeping (rate limit waits, confirmation
+    prompt, state saves) are awaited without blocking, so the loop stays free
+    for other tasks. Pass an async `browser` to share one between concurrent
+    calls; otherwise one is launched for this call.
+
+    Returns:
+        UIRemixResult with new project details, or None if blocked
+    """
+    config = config or get_config()
+    safety = safety or get_safety_manager()
 
+    allowed, reason = await safety.pre_operation_check_async(
+        operation="remix",
+        project_id=project_id,
+        skip_confirmation=skip_confirmation,
+        include_history=include_history,
+    )
+    if not allowed:
+        console.print(f"[red]Blocked: {reason}[/red]")
+        return None
+
+    session_file = config.get_session_file()
+    if not session_file.exists():
+        console.print("[red]No session found. Run 'python cli.py auth' first.[/red]")
+        return UIRemixResult(success=False, error="No session. Authenticate first.")
+
+    storage_state = _load_storage_state(session_file)
+    block_resources = config.block_resources and not debug
+    if browser is not None:
+        return await _remix_in_browser_async(
+            browser, project_id, include_history, storage_state, safety, block_resources,
+        )
+
+    async with async_playwright() as p:
+        browser = await p.chromium.launch(
+            headless=config.headless,
+            slow_mo=config.slow_mo if debug else 0,
+            args=LAUNCH_ARGS,
+        )
+        try:
+            return await _remix_in_browser_async(
+                browser, project_id, include_history, storage_state, safety, block_resources,
+            )
         finally:
-            page.wait_for_timeout(2000)  # Brief pause before closing
-            context.close()
-            browser.close()
+            await browser.close()
+
+
+async def _remix_in_browser_async(
+    browser: AsyncBrowser,
+    project_id: str,
+    include_history: bool,
+    storage_state: Dict[str, Any],
+    safety: SafetyManager,
+    block_resources: bool = False,
+    saved_states: Optional[List[Dict[str, Any]]] = None,
+) -> UIRemixResult:
+    """
+    Async version of the remix flow, with one summary line per project (runs interleave).
+
+    On success the context's storage state is appended to `saved_states`, if given.
+    """
+    console.print(f"[blue]Remixing {project_id}...[/blue]")
+    context = await browser.new_context(storage_state=storage_state, reduced_motion="reduce")
+    try:
+        await context.add_init_script(DISABLE_ANIMATIONS_JS)
+        if block_resources:
+            await context.route("**/*", _route_request_async)
+        page = await context.new_page()
+        page.set_default_timeout(ACTION_TIMEOUT)
+
+        # Step 1: Navigate to project
+        try:
+            await page.goto(
+                f"https://lovable.dev/projects/{project_id}",
+                timeout=NAVIGATION_TIMEOUT,
+                wait_until="commit",
+            )
+        except PlaywrightTimeout:
+            pass  # The menu button wait below surfaces a real failure
+        menu_button = page.locator("button[aria-haspopup='menu']").first
+        await menu_button.wait_for(state="visible", timeout=NAVIGATION_TIMEOUT)
+
+        # Step 2: Open project menu
+        await menu_button.click(timeout=ACTION_TIMEOUT)
+        await page.locator("[role='menuitem']").first.wait_for(state="visible")
+
+        # Step 3: Click "Remix this project"
+        remix_item = page.locator("[role='menuitem']").filter(has_text=_REMIX_ITEM_RE).first
+        await remix_item.wait_for(state="visible", timeout=ACTION_TIMEOUT)
+        remix_responses: asyncio.Queue = asyncio.Queue()
+        page.on("response", lambda r: remix_responses.put_nowait(r) if _is_remix_response(r) else None)
+        await remix_item.click()
+
+        # Step 4: Handle confirmation dialog
+        dialog = page.locator("[role='dialog']")
+        try:
+            await async_expect(dialog).to_be_visible(timeout=DIALOG_TIMEOUT)
+            dialog_shown = True
+        except AssertionError:
+            dialog_shown = False  # No dialog - remix may start directly
+        if dialog_shown:
+            if await page.evaluate(SET_HISTORY_SWITCH_JS, include_history) is None:
+                console.print(
+                    f"[yellow]Warning: {project_id}: 'Include project history' switch not found - "
+                    f"include_history={include_history} could not be applied[/yellow]"
+                )
+
+            await page.locator("[role='dialog'] button:has-text('Remix')").first.click()
+
+        # Step 5: Wait for redirect to new project
+        new_project_id = await _wait_for_new_project_async(page, project_id, remix_responses)
+
+        if new_project_id:
+            new_project_url = f"https://lovable.dev/projects/{new_project_id}"
+            await safety.record_remix_success_async(project_id, new_project_id, include_history)
+            await safety.record_request_async("ui_remix", "/ui/remix", True)
+            console.print(f"[green]✓ {project_id} -> {new_project_url}[/green]")
+            if saved_states is not None:
+                try:
+                    saved_states.append(await context.storage_state())
+                except Exception:
+                    pass  # Saving the session is best effort - the remix succeeded
+            return UIRemixResult(
+                success=True,
+                new_project_id=new_project_id,
+                new_project_url=new_project_url,
+            )
+
+        error = "Timeout waiting for remix to complete"
+        console.print(f"[red]✗ {project_id}: {error}[/red]")
+        await safety.record_request_async("ui_remix", "/ui/remix", False, error=error)
+        return UIRemixResult(success=False, error=error)
+
+    except Exception as e:
+        error_msg = f"Timeout: {e}" if isinstance(e, PlaywrightTimeout) else f"Error: {e}"
+        console.print(f"[red]✗ {project_id}: {error_msg}[/red]")
+        await safety.record_request_async("ui_remix", "/ui/remix", False, error=error_msg)
+        return UIRemixResult(success=False, error=error_msg)
+
+    finally:
+        await context.close()
 
 
 if __name__ == "__main__":